@@ -0,0 +1,361 @@
+from collections import defaultdict, namedtuple
+from typing import Any, Dict, Iterable, List, Mapping
+
+# A single parsed delivery, produced once per ball by the analysis engine
+Ball = namedtuple('Ball', [
+    'innings', 'innings_name', 'team', 'bowling_team', 'key', 'over', 'ball',
+    'batsman', 'non_striker', 'bowler', 'batsman_runs', 'extras', 'total',
+    'legal', 'wicket_kind', 'player_out', 'fielders', 'line'
+])
+
+# Summary of a completed over, passed to on_over_end
+OverSummary = namedtuple('OverSummary', [
+    'innings', 'team', 'bowling_team', 'over', 'bowler', 'legal_balls', 'runs'
+])
+
+
+class StatCollector:
+    """Base class for statistics gathered during the single delivery traversal
+    
+    Override any of the hooks and register an instance with
+    CricketScoreboard.register_collector. Whatever finalize returns is frozen
+    and stored in scoreboard.collector_results under the collector's name.
+    """
+    name = None
+    
+    def reset(self):
+        """Clear any state before a new analysis run"""
+    
+    def on_delivery(self, ball: Ball):
+        """Called once for every delivery, in match order"""
+    
+    def on_wicket(self, ball: Ball):
+        """Called after on_delivery for deliveries that took a wicket"""
+    
+    def on_over_end(self, over: OverSummary):
+        """Called when an over is completed, including the last over of an innings"""
+    
+    def finalize(self, snapshot) -> Any:
+        """Called once after all deliveries have been dispatched
+        
+        snapshot is the MatchSnapshot about to be published, so its data,
+        teams, batting_stats, bowling_stats and team_totals already hold the
+        new match's figures (collector_results is still empty).
+        """
+        return None
+    
+    def get_name(self) -> str:
+        """Name under which the finalized result is stored"""
+        return self.name or type(self).__name__
+
+
+def _overridden_hooks(collectors: List[StatCollector], hook: str) -> List:
+    """Bound hook methods for collectors that actually implement the hook"""
+    base = getattr(StatCollector, hook)
+    return [getattr(c, hook) for c in collectors if getattr(type(c), hook, base) is not base]
+
+
+def dispatch_balls(balls: Iterable[Ball], collectors: List[StatCollector]):
+    """Feed every ball to all collectors in a single traversal"""
+    delivery_hooks = _overridden_hooks(collectors, 'on_delivery')
+    wicket_hooks = _overridden_hooks(collectors, 'on_wicket')
+    over_end_hooks = _overridden_hooks(collectors, 'on_over_end')
+    
+    over_key = None
+    over_runs = 0
+    over_legal_balls = 0
+    last_ball = None
+    
+    for ball in balls:
+        key = (ball.innings, ball.over)
+        if key != over_key:
+            if last_ball is not None and over_end_hooks:
+                summary = OverSummary(last_ball.innings, last_ball.team, last_ball.bowling_team,
+                                      last_ball.over, last_ball.bowler, over_legal_balls, over_runs)
+                for hook in over_end_hooks:
+                    hook(summary)
+            over_key = key
+            over_runs = 0
+            over_legal_balls = 0
+        
+        for hook in delivery_hooks:
+            hook(ball)
+        if ball.wicket_kind is not None:
+            for hook in wicket_hooks:
+                hook(ball)
+        
+        over_runs += ball.total
+        if ball.legal:
+            over_legal_balls += 1
+        last_ball = ball
+    
+    if last_ball is not None and over_end_hooks:
+        summary = OverSummary(last_ball.innings, last_ball.team, last_ball.bowling_team,
+                              last_ball.over, last_ball.bowler, over_legal_balls, over_runs)
+        for hook in over_end_hooks:
+            hook(summary)
+
+
+def format_dismissal(kind: str, bowler: str, fielders) -> str:
+    """Format a dismissal the way it appears on a scorecard"""
+    if kind == 'caught':
+        if fielders:
+            return f"c {', '.join(fielders)} b {bowler}"
+        return f"c & b {bowler}"
+    elif kind == 'bowled':
+        return f"b {bowler}"
+    elif kind == 'lbw':
+        return f"lbw b {bowler}"
+    elif kind == 'stumped':
+        if fielders:
+            return f"st {', '.join(fielders)} b {bowler}"
+        return f"st b {bowler}"
+    elif kind == 'run out':
+        if fielders:
+            return f"run out ({', '.join(fielders)})"
+        return "run out"
+    
+    how_out = f"{kind}"
+    if fielders:
+        how_out += f" ({', '.join(fielders)})"
+    return how_out
+
+
+def batting_rows(players: Mapping[str, Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Scorecard batting rows in batting order"""
+    stats = []
+    for player, data in players.items():
+        if data['runs'] > 0 or data['balls'] > 0 or data['out']:
+            strike_rate = (data['runs'] / data['balls'] * 100) if data['balls'] > 0 else 0
+            stats.append({
+                'position': data['position'],
+                'player': player,
+                'runs': data['runs'],
+                'balls': data['balls'],
+                'fours': data['fours'],
+                'sixes': data['sixes'],
+                'strike_rate': round(strike_rate, 2),
+                'out': data['out'],
+                'how_out': data['how_out'] if data['out'] else 'not out'
+            })
+    
+    # Sort by batting position
+    stats.sort(key=lambda x: x['position'])
+    return stats
+
+def bowling_rows(bowlers: Mapping[str, Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Scorecard bowling rows, best figures first"""
+    stats = []
+    for bowler, data in bowlers.items():
+        if data['overs'] > 0 or data['runs'] > 0 or data['wickets'] > 0:
+            economy = (data['runs'] / data['overs']) if data['overs'] > 0 else 0
+            overs_str = f"{data['balls'] // 6}.{data['balls'] % 6}"
+            
+            stats.append({
+                'bowler': bowler,
+                'overs': overs_str,
+                'maidens': data['maidens'],
+                'runs': data['runs'],
+                'wickets': data['wickets'],
+                'economy': round(economy, 2),
+                'dots': data['dots']
+            })
+    
+    # Sort by wickets (descending) then by economy (ascending)
+    stats.sort(key=lambda x: (-x['wickets'], x['economy']))
+    return stats
+
+
+def _new_batting_entry() -> Dict[str, Any]:
+    return {
+        'runs': 0, 'balls': 0, 'fours': 0, 'sixes': 0,
+        'out': False, 'how_out': '', 'position': 0
+    }
+
+
+def _new_bowling_entry() -> Dict[str, Any]:
+    return {'balls': 0, 'overs': 0, 'runs': 0, 'wickets': 0, 'maidens': 0, 'dots': 0}
+
+
+def _new_team_totals() -> Dict[str, Any]:
+    return {
+        'runs': 0, 'wickets': 0, 'balls': 0, 'overs': 0, 'extras': 0,
+        'run_rate': 0, 'required_rate': 0
+    }
+
+
+class BattingCollector(StatCollector):
+    """Per-player batting figures for the batting team"""
+    name = 'batting'
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.stats = {}
+        self._batting_order = {}
+    
+    def _team_stats(self, team: str) -> Dict:
+        team_stats = self.stats.get(team)
+        if team_stats is None:
+            team_stats = self.stats[team] = defaultdict(_new_batting_entry)
+        return team_stats
+    
+    def on_delivery(self, ball: Ball):
+        player = self._team_stats(ball.team)[ball.batsman]
+        
+        # Batting position is assigned per innings in order of first appearance
+        order = self._batting_order.setdefault(ball.innings, {})
+        if ball.batsman not in order:
+            order[ball.batsman] = len(order) + 1
+            player['position'] = order[ball.batsman]
+        
+        player['runs'] += ball.batsman_runs
+        if ball.legal:
+            player['balls'] += 1
+        if ball.batsman_runs == 4:
+            player['fours'] += 1
+        elif ball.batsman_runs == 6:
+            player['sixes'] += 1
+    
+    def on_wicket(self, ball: Ball):
+        player = self._team_stats(ball.team)[ball.player_out]
+        player['out'] = True
+        player['how_out'] = format_dismissal(ball.wicket_kind, ball.bowler, ball.fielders)
+    
+    def finalize(self, snapshot) -> Dict:
+        for team in snapshot.teams:
+            self._team_stats(team)
+        return self.stats
+
+
+class BowlingCollector(StatCollector):
+    """Per-bowler figures credited to the fielding team"""
+    name = 'bowling'
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.stats = {}
+    
+    def _team_stats(self, team: str) -> Dict:
+        team_stats = self.stats.get(team)
+        if team_stats is None:
+            team_stats = self.stats[team] = defaultdict(_new_bowling_entry)
+        return team_stats
+    
+    def on_delivery(self, ball: Ball):
+        bowler = self._team_stats(ball.bowling_team)[ball.bowler]
+        if ball.legal:
+            # Overs are derived from whole balls to avoid accumulating 1/6 rounding errors
+            bowler['balls'] += 1
+            bowler['overs'] = bowler['balls'] / 6
+        bowler['runs'] += ball.total
+        if ball.total == 0:
+            bowler['dots'] += 1
+    
+    def on_wicket(self, ball: Ball):
+        self._team_stats(ball.bowling_team)[ball.bowler]['wickets'] += 1
+    
+    def on_over_end(self, over: OverSummary):
+        if over.legal_balls == 6 and over.runs == 0 and over.bowler:
+            self._team_stats(over.bowling_team)[over.bowler]['maidens'] += 1
+    
+    def finalize(self, snapshot) -> Dict:
+        for team in snapshot.teams:
+            self._team_stats(team)
+        return self.stats
+
+
+class TeamTotalsCollector(StatCollector):
+    """Innings totals, with a team's latest innings taking precedence"""
+    name = 'team_totals'
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self._innings = {}
+    
+    def on_delivery(self, ball: Ball):
+        innings = self._innings.get(ball.innings)
+        if innings is None:
+            innings = self._innings[ball.innings] = {
+                'team': ball.team, 'runs': 0, 'wickets': 0, 'extras': 0,
+                'last_over': -1, 'over_balls': 0
+            }
+        if ball.over != innings['last_over']:
+            innings['last_over'] = ball.over
+            innings['over_balls'] = 0
+        
+        innings['runs'] += ball.total
+        innings['extras'] += ball.extras
+        if ball.legal:
+            innings['over_balls'] += 1
+    
+    def on_wicket(self, ball: Ball):
+        self._innings[ball.innings]['wickets'] += 1
+    
+    def innings_totals(self) -> List:
+        """(team, totals) for each innings seen, in innings order"""
+        results = []
+        for innings_index in sorted(self._innings):
+            innings = self._innings[innings_index]
+            # Whole balls are carried so overs can be displayed without float truncation
+            balls = innings['last_over'] * 6 + innings['over_balls'] if innings['last_over'] >= 0 else 0
+            overs = balls / 6
+            results.append((innings['team'], {
+                'runs': innings['runs'],
+                'wickets': innings['wickets'],
+                'balls': balls,
+                'overs': overs,
+                'extras': innings['extras'],
+                'run_rate': (innings['runs'] / overs) if overs > 0 else 0
+            }))
+        return results
+    
+    def finalize(self, snapshot) -> Dict:
+        return merge_team_totals([self.innings_totals()], snapshot.teams)
+
+
+def merge_batting_stats(partials: Iterable[Dict], teams: List[str]) -> Dict:
+    """Combine per-innings batting stats in innings order"""
+    merged = {team: defaultdict(_new_batting_entry) for team in teams}
+    for partial in partials:
+        for team, players in partial.items():
+            team_stats = merged.setdefault(team, defaultdict(_new_batting_entry))
+            for player, data in players.items():
+                target = team_stats[player]
+                for field in ('runs', 'balls', 'fours', 'sixes'):
+                    target[field] += data[field]
+                # A later innings' position and dismissal replace earlier ones
+                if data['position']:
+                    target['position'] = data['position']
+                if data['out']:
+                    target['out'] = True
+                    target['how_out'] = data['how_out']
+    return merged
+
+
+def merge_bowling_stats(partials: Iterable[Dict], teams: List[str]) -> Dict:
+    """Combine per-innings bowling stats"""
+    merged = {team: defaultdict(_new_bowling_entry) for team in teams}
+    for partial in partials:
+        for team, bowlers in partial.items():
+            team_stats = merged.setdefault(team, defaultdict(_new_bowling_entry))
+            for bowler, data in bowlers.items():
+                target = team_stats[bowler]
+                for field in ('balls', 'runs', 'wickets', 'maidens', 'dots'):
+                    target[field] += data[field]
+                target['overs'] = target['balls'] / 6
+    return merged
+
+
+def merge_team_totals(partials: Iterable[List], teams: List[str]) -> Dict:
+    """Combine per-innings team totals, with a team's latest innings taking precedence"""
+    merged = {team: _new_team_totals() for team in teams}
+    for partial in partials:
+        for team, totals in partial:
+            merged.setdefault(team, _new_team_totals()).update(totals)
+    return merged
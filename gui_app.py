@@ -1,8 +1,129 @@
+import time
+# Startup time is measured from when this module starts importing, not from interpreter launch
+_START_TIME = time.perf_counter()
+
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk
 import threading
+import json
 import os
-from main import CricketScoreboard
+from snapshot import MatchSnapshot
+
+# File dialogs, message boxes and the analysis engine (which pulls in yaml)
+# are imported on first use so the window appears as early as possible
+SESSION_FILE = os.path.join(os.path.expanduser("~"), ".cricket_scoreboard", "session.json")
+SESSION_VERSION = 2
+
+# Minimum time between table refreshes when data changes quickly (about 30 per second)
+REFRESH_INTERVAL_MS = 33
+# How often the open match file is checked for changes
+FILE_POLL_INTERVAL_MS = 1000
+
+# Treeview columns: (column id, heading, width, anchor)
+BATTING_COLUMNS = (
+    ("Player", "Player", 150, None),
+    ("Runs", "Runs", 80, tk.CENTER),
+    ("Balls", "Balls", 80, tk.CENTER),
+    ("4s", "4s", 60, tk.CENTER),
+    ("6s", "6s", 60, tk.CENTER),
+    ("SR", "Strike Rate", 100, tk.CENTER),
+    ("Status", "Status", 200, None)
+)
+BOWLING_COLUMNS = (
+    ("Bowler", "Bowler", 150, None),
+    ("Overs", "Overs", 80, tk.CENTER),
+    ("Maidens", "Maidens", 80, tk.CENTER),
+    ("Runs", "Runs", 80, tk.CENTER),
+    ("Wickets", "Wickets", 80, tk.CENTER),
+    ("Economy", "Economy", 100, tk.CENTER),
+    ("Dots", "Dot Balls", 100, tk.CENTER)
+)
+TOTALS_COLUMNS = (
+    ("Team", "Team", 200, None),
+    ("Runs", "Runs", 100, tk.CENTER),
+    ("Wickets", "Wickets", 100, tk.CENTER),
+    ("Overs", "Overs", 100, tk.CENTER),
+    ("Extras", "Extras", 100, tk.CENTER),
+    ("Run Rate", "Run Rate", 120, tk.CENTER)
+)
+
+
+def batting_row(stats):
+    """(row id, values) of a batting table row"""
+    return stats['player'], (
+        stats['player'],
+        stats['runs'],
+        stats['balls'],
+        stats['fours'],
+        stats['sixes'],
+        f"{stats['strike_rate']:.2f}",
+        stats['how_out']
+    )
+
+
+def bowling_row(stats):
+    """(row id, values) of a bowling table row"""
+    return stats['bowler'], (
+        stats['bowler'],
+        stats['overs'],
+        stats['maidens'],
+        stats['runs'],
+        stats['wickets'],
+        f"{stats['economy']:.2f}",
+        stats['dots']
+    )
+
+
+def totals_row(team, totals):
+    """(row id, values) of a team totals table row"""
+    overs_str = f"{totals['balls'] // 6}.{totals['balls'] % 6}"
+    return team, (
+        team,
+        totals['runs'],
+        totals['wickets'],
+        overs_str,
+        totals['extras'],
+        f"{totals['run_rate']:.2f}"
+    )
+
+
+def load_session():
+    """Load the saved session snapshot, or None if there is no usable one"""
+    try:
+        with open(SESSION_FILE, 'r', encoding='utf-8') as file:
+            session = json.load(file)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(session, dict) or session.get('version') != SESSION_VERSION:
+        return None
+    return session
+
+
+def save_session(file_path, stat, results):
+    """Save analyzed results of the open match so the next start can show them without re-parsing
+    
+    stat must be taken before the file was read, so a file changed during
+    analysis is seen as changed on the next start.
+    """
+    try:
+        session = {
+            'version': SESSION_VERSION,
+            'matches': [{
+                'file': os.path.abspath(file_path),
+                'mtime': stat.st_mtime,
+                'size': stat.st_size,
+                'results': results
+            }]
+        }
+        os.makedirs(os.path.dirname(SESSION_FILE), exist_ok=True)
+        temp_file = SESSION_FILE + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(session, file, default=str)
+        os.replace(temp_file, SESSION_FILE)
+    except OSError:
+        pass  # A missing session only costs a slower next start
+
 
 class CricketScoreboardGUI:
     def __init__(self, root):
@@ -17,12 +138,33 @@ class CricketScoreboardGUI:
         except:
             pass  # Icon file not found, continue without it
         
-        self.scoreboard = CricketScoreboard()
+        self.scoreboard = None
         self.current_file = None
+        self.snapshot = None
+        self.loaded_file = None
+        self.file_mtime = None
+        self.loading = False
+        self.live_error = False
+        self.startup_time = None
+        
+        # Widgets are created once and then updated in place from each new snapshot
+        self.rendered_tabs = {}
+        self.refresh_job = None
+        self.last_refresh = 0.0
+        self.info_frame = None
+        self.info_rows = {}
+        self.info_order = []
+        self.team_notebooks = {}
+        self.team_tables = {'batting': {}, 'bowling': {}}
+        self.totals_tree = None
+        self.row_cache = {}
         
         self.setup_styles()
         self.create_widgets()
-        self.show_welcome_screen()
+        if not self.restore_session():
+            self.show_welcome_screen()
+        self.root.after_idle(self.report_startup_time)
+        self.root.after(FILE_POLL_INTERVAL_MS, self.watch_current_file)
     
     def setup_styles(self):
         """Configure ttk styles for better appearance"""
@@ -77,6 +219,10 @@ class CricketScoreboardGUI:
         self.progress.grid(row=0, column=2, padx=(10, 0))
         self.progress.grid_remove()
         
+        # Startup timing label
+        self.status_label = ttk.Label(top_frame, text="", foreground="gray")
+        self.status_label.grid(row=0, column=3, padx=(10, 0))
+        
         # Main content area
         self.content_frame = ttk.Frame(main_frame)
         self.content_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -108,6 +254,67 @@ class CricketScoreboardGUI:
         # Team Totals Tab
         self.totals_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(self.totals_frame, text="Team Totals")
+        
+        # Tab contents are built the first time each tab is shown and
+        # updated in place whenever it is shown with a newer snapshot
+        self.tab_builders = {
+            str(self.match_info_frame): self.populate_match_info,
+            str(self.batting_frame): self.populate_batting_stats,
+            str(self.bowling_frame): self.populate_bowling_stats,
+            str(self.totals_frame): self.populate_team_totals
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+    
+    def on_tab_changed(self, event=None):
+        """Bring the selected tab up to date with the current snapshot"""
+        tab = self.notebook.select()
+        if not tab or self.snapshot is None or self.rendered_tabs.get(tab) is self.snapshot:
+            return
+        self.rendered_tabs[tab] = self.snapshot
+        self.tab_builders[tab]()
+    
+    def restore_session(self):
+        """Show the last session's match from its saved snapshot instead of re-parsing it"""
+        session = load_session()
+        if not session or not session.get('matches'):
+            return False
+        
+        # A truncated or hand-edited session falls back to the welcome screen
+        try:
+            match = session['matches'][0]
+            file_path = match.get('file')
+            if not file_path or not os.path.exists(file_path):
+                return False
+            snapshot = MatchSnapshot.from_dict(match['results'])
+            
+            # Build every row the tabs will show, so bad fields fail here and not in a tab callback
+            self.match_info_rows(snapshot.header)
+            for team in snapshot.teams:
+                for stats in snapshot.batting.get(team, ()):
+                    batting_row(stats)
+                for stats in snapshot.bowling.get(team, ()):
+                    bowling_row(stats)
+            for team, totals in snapshot.totals.items():
+                totals_row(team, totals)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+            return False
+        
+        self.current_file = file_path
+        self.file_mtime = match.get('mtime')
+        self.snapshot = snapshot
+        self.file_label.config(text=f"Restored: {os.path.basename(file_path)}", foreground="green")
+        self.show_match_data()
+        
+        # Reload in the background if the file has changed since the snapshot was taken
+        stat = os.stat(file_path)
+        if stat.st_mtime != match.get('mtime') or stat.st_size != match.get('size'):
+            self.root.after_idle(self.start_loading, file_path)
+        return True
+    
+    def report_startup_time(self):
+        """Record and show the time from importing the GUI until the window is interactive"""
+        self.startup_time = time.perf_counter() - _START_TIME
+        self.status_label.config(text=f"Ready in {self.startup_time * 1000:.0f} ms")
     
     def show_welcome_screen(self):
         """Show welcome screen when no file is loaded"""
@@ -151,6 +358,8 @@ class CricketScoreboardGUI:
     
     def load_file(self):
         """Load a YAML file with cricket match data"""
+        from tkinter import filedialog
+        
         file_path = filedialog.askopenfilename(
             title="Select Cricket Match YAML File",
             filetypes=[
@@ -160,32 +369,64 @@ class CricketScoreboardGUI:
         )
         
         if file_path:
-            self.current_file = file_path
+            self.start_loading(file_path)
+    
+    def start_loading(self, file_path, live=False):
+        """Start loading a match file in a background thread"""
+        if self.loading:
+            return
+        self.loading = True
+        self.current_file = file_path
+        
+        # Only one load runs at a time, so a new file cannot be picked during a live reload
+        self.load_button.config(state='disabled')
+        
+        # Live reloads of the open file update the tables without the progress UI
+        if not live:
             self.file_label.config(text=f"Loading: {os.path.basename(file_path)}")
-            
-            # Show progress bar
             self.progress.grid()
             self.progress.start()
-            self.load_button.config(state='disabled')
-            
-            # Load file in background thread
-            thread = threading.Thread(target=self.load_file_worker, args=(file_path,))
-            thread.daemon = True
-            thread.start()
+        
+        # Load file in background thread
+        thread = threading.Thread(target=self.load_file_worker, args=(file_path, live))
+        thread.daemon = True
+        thread.start()
     
-    def load_file_worker(self, file_path):
+    def load_file_worker(self, file_path, live=False):
         """Worker thread for loading file"""
+        mtime = None
         try:
-            success, message = self.scoreboard.load_match_data(file_path)
+            stat = os.stat(file_path)
+            mtime = stat.st_mtime
+            if self.scoreboard is None:
+                from main import CricketScoreboard
+                self.scoreboard = CricketScoreboard()
+            
+            # A corrected or updated version of the open match only recomputes changed innings
+            if self.loaded_file == file_path:
+                success, message = self.scoreboard.reload_match_data(file_path)
+            else:
+                success, message = self.scoreboard.load_match_data(file_path)
+            
+            # Hand the published snapshot to the main thread; it is immutable, so
+            # the GUI can read it while the next load builds a new one
+            snapshot = None
+            if success:
+                self.loaded_file = file_path
+                snapshot = self.scoreboard.snapshot
+                save_session(file_path, stat, snapshot.to_dict())
             
             # Update GUI in main thread
-            self.root.after(0, self.load_file_complete, success, message, file_path)
+            self.root.after(0, self.load_file_complete, success, message, file_path, snapshot, mtime, live)
             
         except Exception as e:
-            self.root.after(0, self.load_file_complete, False, str(e), file_path)
+            self.root.after(0, self.load_file_complete, False, str(e), file_path, None, mtime, live)
     
-    def load_file_complete(self, success, message, file_path):
+    def load_file_complete(self, success, message, file_path, snapshot=None, mtime=None, live=False):
         """Complete file loading process"""
+        self.loading = False
+        self.file_mtime = mtime
+        
         # Hide progress bar
         self.progress.stop()
         self.progress.grid_remove()
@@ -196,13 +437,36 @@ class CricketScoreboardGUI:
                 text=f"Loaded: {os.path.basename(file_path)}",
                 foreground="green"
             )
+            self.snapshot = snapshot
             self.show_match_data()
+            if self.live_error:
+                self.live_error = False
+                self.status_label.config(text="", foreground="gray")
         else:
+            from tkinter import messagebox
+            
             self.file_label.config(
                 text=f"Error loading: {os.path.basename(file_path)}",
                 foreground="red"
             )
-            messagebox.showerror("Load Error", f"Failed to load file:\n{message}")
+            # A live file may be caught mid-write; keep showing the last good snapshot
+            if live:
+                self.live_error = True
+                self.status_label.config(text=f"Reload failed: {message}", foreground="red")
+            else:
+                messagebox.showerror("Load Error", f"Failed to load file:\n{message}")
+    
+    def watch_current_file(self):
+        """Reload the open match when its file changes, e.g. during live scoring"""
+        self.root.after(FILE_POLL_INTERVAL_MS, self.watch_current_file)
+        if self.loading or not self.current_file or self.file_mtime is None:
+            return
+        try:
+            mtime = os.stat(self.current_file).st_mtime
+        except OSError:
+            return
+        if mtime != self.file_mtime:
+            self.start_loading(self.current_file, live=True)
     
     def show_match_data(self):
         """Show the loaded match data in tabs"""
@@ -212,64 +476,146 @@ class CricketScoreboardGUI:
         
         # Show notebook
         self.notebook.grid()
-        
-        # Populate all tabs
-        self.populate_match_info()
-        self.populate_batting_stats()
-        self.populate_bowling_stats()
-        self.populate_team_totals()
+        self.schedule_refresh()
     
-    def populate_match_info(self):
-        """Populate match information tab"""
-        # Clear existing widgets
-        for widget in self.match_info_frame.winfo_children():
-            widget.destroy()
-        
-        header_data = self.scoreboard.get_match_header_data()
-        
-        if not header_data:
-            ttk.Label(self.match_info_frame, text="No match information available").pack()
+    def schedule_refresh(self):
+        """Coalesce snapshot changes into at most one table refresh per frame interval"""
+        if self.refresh_job is not None:
             return
+        elapsed_ms = (time.perf_counter() - self.last_refresh) * 1000
+        delay = max(0, int(REFRESH_INTERVAL_MS - elapsed_ms))
+        self.refresh_job = self.root.after(delay, self.refresh_tables)
+    
+    def refresh_tables(self):
+        """Update the visible tab from the latest snapshot; other tabs catch up when shown"""
+        self.refresh_job = None
+        self.last_refresh = time.perf_counter()
+        self.on_tab_changed()
+    
+    def create_tree(self, parent, columns, height):
+        """Create a Treeview with scrollbars filling the parent frame"""
+        tree = ttk.Treeview(parent, columns=[column[0] for column in columns], show="headings", height=height)
         
-        # Create scrollable frame
-        canvas = tk.Canvas(self.match_info_frame)
-        scrollbar = ttk.Scrollbar(self.match_info_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # Configure columns
+        for column_id, heading, width, anchor in columns:
+            tree.heading(column_id, text=heading)
+            if anchor:
+                tree.column(column_id, width=width, anchor=anchor)
+            else:
+                tree.column(column_id, width=width)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Add scrollbars
+        v_scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=v_scrollbar.set)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        h_scrollbar = ttk.Scrollbar(parent, orient=tk.HORIZONTAL, command=tree.xview)
+        tree.configure(xscrollcommand=h_scrollbar.set)
         
-        # Match details
-        ttk.Label(scrollable_frame, text="Match Information", font=('Arial', 16, 'bold')).pack(pady=(0, 15))
+        tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        info_frame = ttk.Frame(scrollable_frame)
-        info_frame.pack(fill=tk.X, padx=20)
+        parent.columnconfigure(0, weight=1)
+        parent.rowconfigure(0, weight=1)
+        return tree
+    
+    def update_tree(self, tree, rows):
+        """Apply (row id, values) pairs to a Treeview, touching only rows that changed"""
+        # Untouched rows keep their scroll position and selection
+        cache = self.row_cache.setdefault(str(tree), {})
+        wanted = {row_id for row_id, _ in rows}
+        
+        for row_id in [row_id for row_id in cache if row_id not in wanted]:
+            tree.delete(row_id)
+            del cache[row_id]
+        
+        for index, (row_id, values) in enumerate(rows):
+            previous = cache.get(row_id)
+            if previous is None:
+                tree.insert("", index, iid=row_id, values=values)
+            else:
+                if previous != values:
+                    tree.item(row_id, values=values)
+                if tree.index(row_id) != index:
+                    tree.move(row_id, "", index)
+            cache[row_id] = values
+    
+    def populate_match_info(self):
+        """Populate match information tab"""
+        if self.info_frame is None:
+            # Create scrollable frame
+            canvas = tk.Canvas(self.match_info_frame)
+            scrollbar = ttk.Scrollbar(self.match_info_frame, orient="vertical", command=canvas.yview)
+            scrollable_frame = ttk.Frame(canvas)
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Match details
+            ttk.Label(scrollable_frame, text="Match Information", font=('Arial', 16, 'bold')).pack(pady=(0, 15))
+            
+            self.info_frame = ttk.Frame(scrollable_frame)
+            self.info_frame.pack(fill=tk.X, padx=20)
+            
+            canvas.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
+        
+        rows = self.match_info_rows(self.snapshot.header)
+        if not rows:
+            rows = [("Match Information:", "No match information available")]
+        labels = [label for label, _ in rows]
+        
+        for label, value in rows:
+            row = self.info_rows.get(label)
+            if row is None:
+                self.info_rows[label] = self.add_info_row(self.info_frame, label, value)
+            elif row[1].cget('text') != str(value):
+                row[1].config(text=str(value))
+        
+        # Rows are only re-packed when the set or order of fields changes
+        if labels != self.info_order:
+            for label in list(self.info_rows):
+                row_frame = self.info_rows[label][0]
+                row_frame.pack_forget()
+                if label not in labels:
+                    row_frame.destroy()
+                    del self.info_rows[label]
+            for label in labels:
+                self.info_rows[label][0].pack(fill=tk.X, pady=2)
+            self.info_order = labels
+    
+    def match_info_rows(self, header_data):
+        """Build (label, value) rows for the match information tab"""
+        if not header_data:
+            return []
         
         # Basic match info
-        self.add_info_row(info_frame, "Match Type:", header_data.get('match_type', 'Unknown'))
-        self.add_info_row(info_frame, "Venue:", header_data.get('venue', 'Unknown'))
+        rows = [
+            ("Match Type:", header_data.get('match_type', 'Unknown')),
+            ("Venue:", header_data.get('venue', 'Unknown'))
+        ]
         
         if header_data.get('city'):
-            self.add_info_row(info_frame, "City:", header_data['city'])
+            rows.append(("City:", header_data['city']))
         
-        self.add_info_row(info_frame, "Date:", header_data.get('date', 'Unknown'))
+        rows.append(("Date:", header_data.get('date', 'Unknown')))
         
         # Teams
         teams = header_data.get('teams', [])
         if len(teams) >= 2:
-            self.add_info_row(info_frame, "Teams:", f"{teams[0]} vs {teams[1]}")
+            rows.append(("Teams:", f"{teams[0]} vs {teams[1]}"))
         
         # Toss information
         toss = header_data.get('toss', {})
         if toss:
             toss_winner = toss.get('winner', 'Unknown')
             toss_decision = toss.get('decision', 'unknown')
-            self.add_info_row(info_frame, "Toss:", f"{toss_winner} won and chose to {toss_decision}")
+            rows.append(("Toss:", f"{toss_winner} won and chose to {toss_decision}"))
         
         # Match result
         outcome = header_data.get('outcome', {})
@@ -284,230 +630,68 @@ class CricketScoreboardGUI:
                 elif 'wickets' in by:
                     result_text += f" by {by['wickets']} wickets"
             
-            self.add_info_row(info_frame, "Result:", result_text)
+            rows.append(("Result:", result_text))
         elif 'result' in outcome:
-            self.add_info_row(info_frame, "Result:", outcome['result'])
+            rows.append(("Result:", outcome['result']))
         
         # Player of the match
         pom = header_data.get('player_of_match', [])
         if pom:
-            if isinstance(pom, list):
-                self.add_info_row(info_frame, "Player of the Match:", ', '.join(pom))
+            if isinstance(pom, (list, tuple)):
+                rows.append(("Player of the Match:", ', '.join(pom)))
             else:
-                self.add_info_row(info_frame, "Player of the Match:", pom)
+                rows.append(("Player of the Match:", pom))
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        return rows
     
     def add_info_row(self, parent, label, value):
-        """Add an information row to the match info"""
+        """Add an information row to the match info, returning its frame and value label"""
         row_frame = ttk.Frame(parent)
-        row_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(row_frame, text=label, font=('Arial', 10, 'bold')).pack(side=tk.LEFT, anchor=tk.W)
-        ttk.Label(row_frame, text=str(value)).pack(side=tk.LEFT, anchor=tk.W, padx=(10, 0))
+        value_label = ttk.Label(row_frame, text=str(value))
+        value_label.pack(side=tk.LEFT, anchor=tk.W, padx=(10, 0))
+        return row_frame, value_label
+    
+    def update_team_tables(self, kind, parent, columns, make_row):
+        """Keep one Treeview per team in a notebook and update its rows in place"""
+        team_notebook = self.team_notebooks.get(kind)
+        if team_notebook is None:
+            # Create notebook for teams
+            team_notebook = self.team_notebooks[kind] = ttk.Notebook(parent)
+            team_notebook.pack(fill=tk.BOTH, expand=True)
+        
+        tables = self.team_tables[kind]
+        teams = self.snapshot.teams
+        for team in [team for team in tables if team not in teams]:
+            team_frame, tree = tables.pop(team)
+            self.row_cache.pop(str(tree), None)
+            team_notebook.forget(team_frame)
+            team_frame.destroy()
+        
+        team_stats = getattr(self.snapshot, kind)
+        for team in teams:
+            if team not in tables:
+                team_frame = ttk.Frame(team_notebook, padding="10")
+                team_notebook.add(team_frame, text=team)
+                tables[team] = (team_frame, self.create_tree(team_frame, columns, height=15))
+            self.update_tree(tables[team][1], [make_row(stats) for stats in team_stats.get(team, ())])
     
     def populate_batting_stats(self):
         """Populate batting statistics tab"""
-        # Clear existing widgets
-        for widget in self.batting_frame.winfo_children():
-            widget.destroy()
-        
-        teams = list(self.scoreboard.team_totals.keys())
-        
-        if not teams:
-            ttk.Label(self.batting_frame, text="No batting statistics available").pack()
-            return
-        
-        # Create notebook for teams
-        team_notebook = ttk.Notebook(self.batting_frame)
-        team_notebook.pack(fill=tk.BOTH, expand=True)
-        
-        for team in teams:
-            team_frame = ttk.Frame(team_notebook, padding="10")
-            team_notebook.add(team_frame, text=team)
-            
-            # Get batting stats for this team
-            batting_stats = self.scoreboard.get_batting_stats_for_team(team)
-            
-            if not batting_stats:
-                ttk.Label(team_frame, text=f"No batting statistics available for {team}").pack()
-                continue
-            
-            # Create treeview for batting stats
-            columns = ("Player", "Runs", "Balls", "4s", "6s", "SR", "Status")
-            tree = ttk.Treeview(team_frame, columns=columns, show="headings", height=15)
-            
-            # Configure columns
-            tree.heading("Player", text="Player")
-            tree.heading("Runs", text="Runs")
-            tree.heading("Balls", text="Balls")
-            tree.heading("4s", text="4s")
-            tree.heading("6s", text="6s")
-            tree.heading("SR", text="Strike Rate")
-            tree.heading("Status", text="Status")
-            
-            tree.column("Player", width=150)
-            tree.column("Runs", width=80, anchor=tk.CENTER)
-            tree.column("Balls", width=80, anchor=tk.CENTER)
-            tree.column("4s", width=60, anchor=tk.CENTER)
-            tree.column("6s", width=60, anchor=tk.CENTER)
-            tree.column("SR", width=100, anchor=tk.CENTER)
-            tree.column("Status", width=200)
-            
-            # Add data
-            for stats in batting_stats:
-                tree.insert("", tk.END, values=(
-                    stats['player'],
-                    stats['runs'],
-                    stats['balls'],
-                    stats['fours'],
-                    stats['sixes'],
-                    f"{stats['strike_rate']:.2f}",
-                    stats['how_out']
-                ))
-            
-            # Add scrollbars
-            v_scrollbar = ttk.Scrollbar(team_frame, orient=tk.VERTICAL, command=tree.yview)
-            tree.configure(yscrollcommand=v_scrollbar.set)
-            
-            h_scrollbar = ttk.Scrollbar(team_frame, orient=tk.HORIZONTAL, command=tree.xview)
-            tree.configure(xscrollcommand=h_scrollbar.set)
-            
-            tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-            v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-            h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
-            
-            team_frame.columnconfigure(0, weight=1)
-            team_frame.rowconfigure(0, weight=1)
+        self.update_team_tables('batting', self.batting_frame, BATTING_COLUMNS, batting_row)
     
     def populate_bowling_stats(self):
         """Populate bowling statistics tab"""
-        # Clear existing widgets
-        for widget in self.bowling_frame.winfo_children():
-            widget.destroy()
-        
-        teams = list(self.scoreboard.team_totals.keys())
-        
-        if not teams:
-            ttk.Label(self.bowling_frame, text="No bowling statistics available").pack()
-            return
-        
-        # Create notebook for teams
-        team_notebook = ttk.Notebook(self.bowling_frame)
-        team_notebook.pack(fill=tk.BOTH, expand=True)
-        
-        for team in teams:
-            team_frame = ttk.Frame(team_notebook, padding="10")
-            team_notebook.add(team_frame, text=team)
-            
-            # Get bowling stats for this team
-            bowling_stats = self.scoreboard.get_bowling_stats_for_team(team)
-            
-            if not bowling_stats:
-                ttk.Label(team_frame, text=f"No bowling statistics available for {team}").pack()
-                continue
-            
-            # Create treeview for bowling stats
-            columns = ("Bowler", "Overs", "Maidens", "Runs", "Wickets", "Economy", "Dots")
-            tree = ttk.Treeview(team_frame, columns=columns, show="headings", height=15)
-            
-            # Configure columns
-            tree.heading("Bowler", text="Bowler")
-            tree.heading("Overs", text="Overs")
-            tree.heading("Maidens", text="Maidens")
-            tree.heading("Runs", text="Runs")
-            tree.heading("Wickets", text="Wickets")
-            tree.heading("Economy", text="Economy")
-            tree.heading("Dots", text="Dot Balls")
-            
-            tree.column("Bowler", width=150)
-            tree.column("Overs", width=80, anchor=tk.CENTER)
-            tree.column("Maidens", width=80, anchor=tk.CENTER)
-            tree.column("Runs", width=80, anchor=tk.CENTER)
-            tree.column("Wickets", width=80, anchor=tk.CENTER)
-            tree.column("Economy", width=100, anchor=tk.CENTER)
-            tree.column("Dots", width=100, anchor=tk.CENTER)
-            
-            # Add data
-            for stats in bowling_stats:
-                tree.insert("", tk.END, values=(
-                    stats['bowler'],
-                    stats['overs'],
-                    stats['maidens'],
-                    stats['runs'],
-                    stats['wickets'],
-                    f"{stats['economy']:.2f}",
-                    stats['dots']
-                ))
-            
-            # Add scrollbars
-            v_scrollbar = ttk.Scrollbar(team_frame, orient=tk.VERTICAL, command=tree.yview)
-            tree.configure(yscrollcommand=v_scrollbar.set)
-            
-            h_scrollbar = ttk.Scrollbar(team_frame, orient=tk.HORIZONTAL, command=tree.xview)
-            tree.configure(xscrollcommand=h_scrollbar.set)
-            
-            tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-            v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-            h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
-            
-            team_frame.columnconfigure(0, weight=1)
-            team_frame.rowconfigure(0, weight=1)
+        self.update_team_tables('bowling', self.bowling_frame, BOWLING_COLUMNS, bowling_row)
     
     def populate_team_totals(self):
         """Populate team totals tab"""
-        # Clear existing widgets
-        for widget in self.totals_frame.winfo_children():
-            widget.destroy()
-        
-        team_totals = self.scoreboard.get_team_totals()
-        
-        if not team_totals:
-            ttk.Label(self.totals_frame, text="No team totals available").pack()
-            return
-        
-        # Create treeview for team totals
-        columns = ("Team", "Runs", "Wickets", "Overs", "Extras", "Run Rate")
-        tree = ttk.Treeview(self.totals_frame, columns=columns, show="headings", height=10)
-        
-        # Configure columns
-        tree.heading("Team", text="Team")
-        tree.heading("Runs", text="Runs")
-        tree.heading("Wickets", text="Wickets")
-        tree.heading("Overs", text="Overs")
-        tree.heading("Extras", text="Extras")
-        tree.heading("Run Rate", text="Run Rate")
-        
-        tree.column("Team", width=200)
-        tree.column("Runs", width=100, anchor=tk.CENTER)
-        tree.column("Wickets", width=100, anchor=tk.CENTER)
-        tree.column("Overs", width=100, anchor=tk.CENTER)
-        tree.column("Extras", width=100, anchor=tk.CENTER)
-        tree.column("Run Rate", width=120, anchor=tk.CENTER)
-        
-        # Add data
-        for team, totals in team_totals.items():
-            overs_str = f"{int(totals['overs'])}.{int((totals['overs'] % 1) * 6)}"
-            tree.insert("", tk.END, values=(
-                team,
-                totals['runs'],
-                totals['wickets'],
-                overs_str,
-                totals['extras'],
-                f"{totals['run_rate']:.2f}"
-            ))
-        
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(self.totals_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=v_scrollbar.set)
-        
-        h_scrollbar = ttk.Scrollbar(self.totals_frame, orient=tk.HORIZONTAL, command=tree.xview)
-        tree.configure(xscrollcommand=h_scrollbar.set)
+        if self.totals_tree is None:
+            self.totals_tree = self.create_tree(self.totals_frame, TOTALS_COLUMNS, height=10)
         
-        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        rows = [totals_row(team, totals) for team, totals in self.snapshot.totals.items()]
+        self.update_tree(self.totals_tree, rows)
 
 def main():
     """Main application entry point"""
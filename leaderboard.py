@@ -0,0 +1,216 @@
+import argparse
+import heapq
+import itertools
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from main import CricketScoreboard, collect_match_files
+
+# Ranking metrics: (stats section, value function, higher is better)
+METRICS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Optional[float]], bool]] = {
+    'runs': ('batting', lambda s: s['runs'], True),
+    'fours': ('batting', lambda s: s['fours'], True),
+    'sixes': ('batting', lambda s: s['sixes'], True),
+    'strike_rate': ('batting', lambda s: s['runs'] / s['balls'] * 100 if s['balls'] else None, True),
+    'batting_average': ('batting', lambda s: s['runs'] / s['outs'] if s['outs'] else None, True),
+    'wickets': ('bowling', lambda s: s['wickets'], True),
+    'dots': ('bowling', lambda s: s['dots'], True),
+    'economy': ('bowling', lambda s: s['runs'] / (s['balls'] / 6) if s['balls'] else None, False),
+    'bowling_average': ('bowling', lambda s: s['runs'] / s['wickets'] if s['wickets'] else None, False),
+}
+
+BATTING_FIELDS = ('runs', 'balls', 'fours', 'sixes', 'outs', 'matches')
+BOWLING_FIELDS = ('balls', 'runs', 'wickets', 'maidens', 'dots', 'matches')
+
+
+class _RankingHeap:
+    """Heap of qualified players with lazy invalidation of superseded entries
+    
+    Updates push a new versioned entry in O(log n); reading the top k pops
+    valid entries (discarding stale ones for good) and pushes them back.
+    """
+    
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self._heap = []
+        self._current = {}
+        self._versions = itertools.count()
+    
+    def update(self, player: str, value: Optional[float]):
+        """Set a player's ranking value, or remove them when value is None"""
+        if value is None:
+            self._current.pop(player, None)
+            return
+        key = -value if self.descending else value
+        current = self._current.get(player)
+        if current is not None and current[0] == key:
+            return
+        entry = (key, player, next(self._versions))
+        self._current[player] = entry
+        heapq.heappush(self._heap, entry)
+        
+        # Keep stale entries from dominating the heap
+        if len(self._heap) > 2 * len(self._current) + 64:
+            self._heap = list(self._current.values())
+            heapq.heapify(self._heap)
+    
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        """The k best players with their values"""
+        valid = []
+        while self._heap and len(valid) < k:
+            entry = heapq.heappop(self._heap)
+            if self._current.get(entry[1]) is entry:
+                valid.append(entry)
+        for entry in valid:
+            heapq.heappush(self._heap, entry)
+        return [(player, -key if self.descending else key) for key, player, _ in valid]
+
+
+class Leaderboard:
+    """Player aggregates across ingested matches with incrementally maintained rankings"""
+    
+    def __init__(self):
+        self.batting = {}
+        self.bowling = {}
+        self.matches = {}
+        self._rankings = {}
+    
+    def load_match(self, file_path: str, strict: bool = False) -> tuple:
+        """Load a match file and add it to the leaderboard"""
+        scoreboard = CricketScoreboard()
+        success, message = scoreboard.load_match_data(file_path, strict=strict)
+        if not success:
+            return False, message
+        self.add_match(scoreboard, os.path.abspath(file_path))
+        return True, "Match added to leaderboard"
+    
+    def add_match(self, scoreboard: CricketScoreboard, match_id: str):
+        """Add an analyzed match, replacing any previous version with the same id"""
+        if match_id in self.matches:
+            self.remove_match(match_id)
+        
+        contribution = self._match_contribution(scoreboard)
+        self.matches[match_id] = contribution
+        self._apply(contribution, 1)
+    
+    def remove_match(self, match_id: str):
+        """Remove a previously added match from all aggregates"""
+        contribution = self.matches.pop(match_id, None)
+        if contribution is not None:
+            self._apply(contribution, -1)
+    
+    def _match_contribution(self, scoreboard: CricketScoreboard) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Per-player figures a single match adds to the aggregates"""
+        # Match rows only record whether a batter was out; count dismissals per innings
+        outs = {}
+        for innings in scoreboard.snapshot.innings.values():
+            for players in innings['batting'].values():
+                for player, data in players.items():
+                    if data['out']:
+                        outs[player] = outs.get(player, 0) + 1
+        
+        batting = {}
+        for team in scoreboard.team_totals:
+            for stats in scoreboard.get_batting_stats_for_team(team):
+                batting[stats['player']] = {
+                    'runs': stats['runs'], 'balls': stats['balls'],
+                    'fours': stats['fours'], 'sixes': stats['sixes'],
+                    'outs': outs.get(stats['player'], 0), 'matches': 1
+                }
+        
+        bowling = {}
+        for team, team_stats in scoreboard.bowling_stats.items():
+            for bowler, data in team_stats.items():
+                if data['overs'] > 0 or data['runs'] > 0 or data['wickets'] > 0:
+                    bowling[bowler] = {
+                        'balls': data['balls'], 'runs': data['runs'],
+                        'wickets': data['wickets'], 'maidens': data['maidens'],
+                        'dots': data['dots'], 'matches': 1
+                    }
+        
+        return {'batting': batting, 'bowling': bowling}
+    
+    def _apply(self, contribution: Dict, sign: int):
+        """Add or subtract a match contribution and refresh affected rankings"""
+        for section, fields in (('batting', BATTING_FIELDS), ('bowling', BOWLING_FIELDS)):
+            aggregates = getattr(self, section)
+            for player, figures in contribution[section].items():
+                totals = aggregates.get(player)
+                if totals is None:
+                    totals = aggregates[player] = dict.fromkeys(fields, 0)
+                for field in fields:
+                    totals[field] += sign * figures[field]
+                if totals['matches'] == 0:
+                    del aggregates[player]
+                    totals = None
+                
+                # Only the players in this match can change position
+                for (metric, min_balls, min_overs), ranking in self._rankings.items():
+                    if METRICS[metric][0] == section:
+                        ranking.update(player, self._ranking_value(metric, totals, min_balls, min_overs))
+    
+    @staticmethod
+    def _ranking_value(metric: str, totals: Optional[Dict], min_balls: int, min_overs: float) -> Optional[float]:
+        """Metric value for a player, or None if they do not qualify"""
+        if totals is None:
+            return None
+        section, value_fn, _ = METRICS[metric]
+        if section == 'batting' and totals['balls'] < min_balls:
+            return None
+        if section == 'bowling' and totals['balls'] < min_overs * 6:
+            return None
+        return value_fn(totals)
+    
+    def top(self, metric: str, k: int = 10, min_balls: int = 0, min_overs: float = 0) -> List[Dict[str, Any]]:
+        """Top k players for a metric among those meeting the qualification thresholds"""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Choose from: {', '.join(METRICS)}")
+        
+        # Each (metric, threshold) ranking is built once, then kept up to date as matches arrive
+        ranking_key = (metric, min_balls, min_overs)
+        ranking = self._rankings.get(ranking_key)
+        section, _, descending = METRICS[metric]
+        aggregates = getattr(self, section)
+        if ranking is None:
+            ranking = self._rankings[ranking_key] = _RankingHeap(descending)
+            for player, totals in aggregates.items():
+                ranking.update(player, self._ranking_value(metric, totals, min_balls, min_overs))
+        
+        leaders = []
+        for rank, (player, value) in enumerate(ranking.top(k), start=1):
+            entry = {'rank': rank, 'player': player, metric: round(value, 2)}
+            entry.update(aggregates[player])
+            leaders.append(entry)
+        return leaders
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line interface for printing leaderboards"""
+    parser = argparse.ArgumentParser(description="Rank players across cricket match YAML files")
+    parser.add_argument('paths', nargs='+', help="match files or directories of match files")
+    parser.add_argument('--metric', default='runs', choices=list(METRICS), help="statistic to rank by")
+    parser.add_argument('--top', type=int, default=10, help="number of players to show")
+    parser.add_argument('--min-balls', type=int, default=0, help="minimum balls faced for batting metrics")
+    parser.add_argument('--min-overs', type=float, default=0, help="minimum overs bowled for bowling metrics")
+    args = parser.parse_args(argv)
+    
+    leaderboard = Leaderboard()
+    for file_path in collect_match_files(args.paths):
+        success, message = leaderboard.load_match(file_path)
+        if not success:
+            print(f"Skipping {file_path}: {message}", file=sys.stderr)
+    
+    leaders = leaderboard.top(args.metric, args.top, args.min_balls, args.min_overs)
+    if not leaders:
+        print("No qualifying players found")
+        return 0
+    
+    print(f"Top {len(leaders)} by {args.metric} ({len(leaderboard.matches)} matches)")
+    for entry in leaders:
+        print(f"{entry['rank']:>3}. {entry['player']:<25} {entry[args.metric]:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
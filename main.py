@@ -1,38 +1,101 @@
 import yaml
+import hashlib
 import os
 import sys
 from collections import defaultdict
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Tuple
+from collectors import (
+    Ball, StatCollector, BattingCollector, BowlingCollector, TeamTotalsCollector,
+    dispatch_balls, merge_batting_stats, merge_bowling_stats, merge_team_totals,
+    batting_rows, bowling_rows
+)
+from snapshot import MatchSnapshot, freeze
+
+
+class _LineDict(dict):
+    """Dictionary that remembers the source line it was parsed from"""
+    line = None
+
+
+class _LineLoader(yaml.SafeLoader):
+    """Safe YAML loader that tags every mapping with its source line number"""
+
+
+def _construct_line_mapping(loader, node):
+    data = _LineDict()
+    data.line = node.start_mark.line + 1
+    yield data
+    data.update(loader.construct_mapping(node))
+
+
+_LineLoader.add_constructor('tag:yaml.org,2002:map', _construct_line_mapping)
+
 
 class CricketScoreboard:
     def __init__(self, yaml_file_path: str = None):
         self.data = None
-        self.batting_stats = {}
-        self.bowling_stats = {}
-        self.team_totals = {}
         self.partnership_stats = {}
+        self.teams = []
+        self.collectors = []
+        self.validation_errors = []
+        self.reload_changes = {'innings': [], 'deliveries': [], 'stats': []}
+        self._strict = False
+        
+        # Readers only ever see a complete analysis: each load builds a new
+        # immutable snapshot and publishes it with one reference assignment
+        self.snapshot = MatchSnapshot()
         
         if yaml_file_path:
             self.load_match_data(yaml_file_path)
     
-    def load_match_data(self, file_path: str) -> bool:
+    @property
+    def batting_stats(self) -> Mapping[str, Mapping[str, Mapping[str, Any]]]:
+        """Per-player batting stats by team from the current snapshot"""
+        return self.snapshot.batting_stats
+    
+    @property
+    def bowling_stats(self) -> Mapping[str, Mapping[str, Mapping[str, Any]]]:
+        """Per-bowler stats by team from the current snapshot"""
+        return self.snapshot.bowling_stats
+    
+    @property
+    def team_totals(self) -> Mapping[str, Mapping[str, Any]]:
+        """Team totals from the current snapshot"""
+        return self.snapshot.team_totals
+    
+    @property
+    def collector_results(self) -> Mapping[str, Any]:
+        """Finalized results of registered collectors from the current snapshot"""
+        return self.snapshot.collector_results
+    
+    def load_match_data(self, file_path: str, strict: bool = False) -> bool:
         """Load cricket match data from YAML file with comprehensive error handling"""
+        # In strict mode the schema is checked inside the analysis pass and every
+        # problem is collected in validation_errors before the file is rejected
+        self.validation_errors = []
         try:
             if not os.path.exists(file_path):
                 return False, f"File '{file_path}' not found!"
             
+            # The parsed document only replaces self.data once its snapshot is published
             with open(file_path, 'r', encoding='utf-8') as file:
-                self.data = yaml.safe_load(file)
+                if strict:
+                    data = yaml.load(file, Loader=_LineLoader)
+                else:
+                    data = yaml.safe_load(file)
                 
-            if not self.data:
+            if not data:
                 return False, "YAML file is empty or invalid!"
             
             # Validate basic structure
-            valid, error_msg = self.validate_yaml_structure()
+            valid, error_msg = self.validate_yaml_structure(data)
             if not valid:
                 return False, error_msg
             
-            self.analyze_match_data()
+            self.analyze_match_data(strict=strict, data=data)
+            if self.validation_errors:
+                return False, self.format_validation_errors()
             return True, "Successfully loaded match data"
             
         except yaml.YAMLError as e:
@@ -40,215 +103,452 @@ class CricketScoreboard:
         except Exception as e:
             return False, f"Unexpected error loading file: {e}"
     
-    def validate_yaml_structure(self) -> tuple:
-        """Validate the YAML structure for required cricket data"""
-        if not isinstance(self.data, dict):
+    def validate_yaml_structure(self, data: Any = None) -> tuple:
+        """Validate the YAML structure for required cricket data (defaults to the loaded document)"""
+        if data is None:
+            data = self.data
+        if not isinstance(data, dict):
             return False, "YAML root must be a dictionary"
         
         # Check for essential sections
-        if 'innings' not in self.data:
+        if 'innings' not in data:
             return False, "No 'innings' section found in YAML"
         
-        if not isinstance(self.data['innings'], list):
+        if not isinstance(data['innings'], list):
             return False, "'innings' must be a list"
         
-        if len(self.data['innings']) == 0:
+        if len(data['innings']) == 0:
             return False, "No innings data found"
         
         # Check info section
-        info = self.data.get('info', {})
+        info = data.get('info', {})
         if not info.get('teams'):
             # This is just a warning, not an error
             pass
         
         return True, "YAML structure validation passed"
     
-    def analyze_match_data(self):
-        """Comprehensive analysis of match data to calculate all statistics"""
-        if not self.data or 'innings' not in self.data:
+    def format_validation_errors(self, limit: int = 20) -> str:
+        """Format collected strict validation errors into a readable message"""
+        lines = [f"{len(self.validation_errors)} schema error(s) found:"]
+        for error in self.validation_errors[:limit]:
+            location = error['innings'] or 'match'
+            if error['ball'] is not None:
+                location += f", ball {error['ball']}"
+            if error['line'] is not None:
+                location += f" (line {error['line']})"
+            lines.append(f"  {location}: {error['message']}")
+        if len(self.validation_errors) > limit:
+            lines.append(f"  ... and {len(self.validation_errors) - limit} more")
+        return "\n".join(lines)
+    
+    def _add_validation_error(self, innings: str, ball: Optional[str], node: Any, message: str):
+        """Record a strict validation error with its location"""
+        self.validation_errors.append({
+            'innings': innings,
+            'ball': ball,
+            'line': getattr(node, 'line', None),
+            'message': message
+        })
+    
+    def _validate_innings(self, innings_key: str, innings_info: Any) -> bool:
+        """Check the header of a single innings, returning whether it can be analyzed"""
+        if not isinstance(innings_info, dict):
+            self._add_validation_error(innings_key, None, innings_info, "innings must be a mapping")
+            return False
+        
+        valid = True
+        if not isinstance(innings_info.get('team'), str):
+            self._add_validation_error(innings_key, None, innings_info, "missing or invalid 'team'")
+        if not isinstance(innings_info.get('deliveries', []), list):
+            self._add_validation_error(innings_key, None, innings_info, "'deliveries' must be a list")
+            valid = False
+        return valid
+    
+    def _validate_delivery(self, innings_key: str, ball_key: str, ball_data: Any, line_node: Any) -> bool:
+        """Check a single delivery against the schema, returning whether it can be analyzed"""
+        if not isinstance(ball_data, dict):
+            self._add_validation_error(innings_key, ball_key, line_node, "delivery must be a mapping")
+            return False
+        
+        valid = True
+        for field in ('batsman', 'bowler'):
+            if not isinstance(ball_data.get(field), str):
+                self._add_validation_error(innings_key, ball_key, ball_data, f"missing or invalid '{field}'")
+        
+        runs = ball_data.get('runs')
+        if not isinstance(runs, dict):
+            self._add_validation_error(innings_key, ball_key, ball_data, "missing or invalid 'runs'")
+            valid = False
+        else:
+            counts = {}
+            for field in ('batsman', 'extras', 'total'):
+                value = runs.get(field)
+                if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                    self._add_validation_error(innings_key, ball_key, runs, f"'runs.{field}' must be a non-negative integer")
+                    valid = False
+                else:
+                    counts[field] = value
+            if len(counts) == 3 and counts['batsman'] + counts['extras'] != counts['total']:
+                self._add_validation_error(
+                    innings_key, ball_key, runs,
+                    f"'runs.total' ({counts['total']}) does not equal batsman + extras "
+                    f"({counts['batsman']} + {counts['extras']})"
+                )
+        
+        extras = ball_data.get('extras')
+        if extras is not None and not isinstance(extras, dict):
+            self._add_validation_error(innings_key, ball_key, ball_data, "'extras' must be a mapping")
+            valid = False
+        
+        if 'wicket' in ball_data:
+            wicket = ball_data['wicket']
+            if not isinstance(wicket, dict):
+                self._add_validation_error(innings_key, ball_key, ball_data, "'wicket' must be a mapping")
+                valid = False
+            else:
+                if not isinstance(wicket.get('kind'), str):
+                    self._add_validation_error(innings_key, ball_key, wicket, "missing or invalid 'wicket.kind'")
+                if not isinstance(wicket.get('player_out'), str):
+                    self._add_validation_error(innings_key, ball_key, wicket, "missing or invalid 'wicket.player_out'")
+                if not isinstance(wicket.get('fielders', []), list):
+                    self._add_validation_error(innings_key, ball_key, wicket, "'wicket.fielders' must be a list")
+                    valid = False
+        
+        return valid
+    
+    def register_collector(self, collector: StatCollector):
+        """Register a custom statistics collector to run during analysis"""
+        self.collectors.append(collector)
+    
+    def unregister_collector(self, collector: StatCollector):
+        """Remove a previously registered collector"""
+        self.collectors.remove(collector)
+    
+    @staticmethod
+    def _identify_teams(data: Dict) -> List[str]:
+        """Teams from the match info, plus any batting team only named in an innings header"""
+        teams = [team for team in data.get('info', {}).get('teams', []) or [] if isinstance(team, str)]
+        for innings_data in data['innings']:
+            if not isinstance(innings_data, dict):
+                continue
+            for innings_info in innings_data.values():
+                if isinstance(innings_info, dict):
+                    team = innings_info.get('team', 'Unknown Team')
+                    if team not in teams:
+                        teams.append(team)
+        return teams
+    
+    def analyze_match_data(self, strict: bool = False, data: Dict = None):
+        """Comprehensive analysis of match data (defaults to the loaded document) to calculate all statistics"""
+        if data is None:
+            data = self.data
+        if not data or 'innings' not in data:
             return
         
-        # Initialize stats dictionaries
-        all_teams = set()
+        self._strict = strict
+        teams = self._identify_teams(data)
+        for collector in self.collectors:
+            collector.reset()
+        
+        # Built-in stats are kept per innings so a corrected file only needs its
+        # changed innings recomputed; registered collectors share the same pass
+        innings_results = {}
+        for innings_index, innings_key, innings_info in self._iter_innings(data):
+            innings_results[(innings_index, innings_key)] = self._analyze_innings(
+                innings_info, innings_index, innings_key, teams, self.collectors
+            )
         
-        # First pass: identify all teams
-        for innings_data in self.data['innings']:
+        # A file rejected by strict validation never replaces the current snapshot
+        if strict and self.validation_errors:
+            return
+        
+        self._publish(data, teams, innings_results)
+    
+    def _iter_innings(self, data: Dict):
+        """Yield (index, name, info) for every innings, validating headers in strict mode"""
+        strict = self._strict
+        
+        for innings_index, innings_data in enumerate(data['innings']):
+            if not isinstance(innings_data, dict):
+                if strict:
+                    self._add_validation_error(f"innings #{innings_index + 1}", None, innings_data, "innings entry must be a mapping")
+                    continue
             for innings_key, innings_info in innings_data.items():
-                team = innings_info.get('team', 'Unknown Team')
-                all_teams.add(team)
-        
-        # Initialize stats for all teams
-        for team in all_teams:
-            self.batting_stats[team] = defaultdict(lambda: {
-                'runs': 0, 'balls': 0, 'fours': 0, 'sixes': 0, 
-                'out': False, 'how_out': '', 'position': 0
-            })
-            self.bowling_stats[team] = defaultdict(lambda: {
-                'overs': 0, 'runs': 0, 'wickets': 0, 'maidens': 0, 'dots': 0
-            })
-            self.team_totals[team] = {
-                'runs': 0, 'wickets': 0, 'overs': 0, 'extras': 0,
-                'run_rate': 0, 'required_rate': 0
+                if strict and not self._validate_innings(innings_key, innings_info):
+                    continue
+                yield innings_index, innings_key, innings_info
+    
+    def _analyze_innings(self, innings_info: Dict, innings_index: int, innings_key: str,
+                         teams: List[str], collectors: List[StatCollector] = ()) -> Dict[str, Any]:
+        """Analyze individual innings data into its own built-in stats"""
+        balls = tuple(self._iter_innings_balls(innings_info, innings_index, innings_key, teams))
+        
+        batting = BattingCollector()
+        bowling = BowlingCollector()
+        totals = TeamTotalsCollector()
+        dispatch_balls(balls, [batting, bowling, totals] + list(collectors))
+        
+        return MappingProxyType({
+            'balls': balls,
+            'batting': freeze(batting.stats),
+            'bowling': freeze(bowling.stats),
+            'totals': freeze(totals.innings_totals())
+        })
+    
+    def _publish(self, data: Dict, teams: List[str], innings_results: Dict):
+        """Build the match-wide snapshot from per-innings stats and swap it in"""
+        results = list(innings_results.values())
+        batting_stats = merge_batting_stats((r['batting'] for r in results), teams)
+        bowling_stats = merge_bowling_stats((r['bowling'] for r in results), teams)
+        team_totals = merge_team_totals((r['totals'] for r in results), teams)
+        
+        snapshot = MatchSnapshot(
+            data=data,
+            header=freeze(self._build_header(data)),
+            teams=tuple(team_totals),
+            batting_stats=freeze(batting_stats),
+            bowling_stats=freeze(bowling_stats),
+            team_totals=freeze(team_totals),
+            batting=MappingProxyType({
+                team: freeze(batting_rows(players)) for team, players in batting_stats.items()
+            }),
+            bowling=MappingProxyType({
+                team: freeze(bowling_rows(bowlers)) for team, bowlers in bowling_stats.items()
+            }),
+            innings=MappingProxyType(dict(innings_results))
+        )
+        
+        # Collectors finalize against the new figures; their results are frozen
+        # so a later reset() cannot change what this snapshot publishes
+        if self.collectors:
+            snapshot = snapshot.replace(collector_results=MappingProxyType({
+                collector.get_name(): freeze(collector.finalize(snapshot)) for collector in self.collectors
+            }))
+        
+        self.data = data
+        self.teams = teams
+        self.partnership_stats = {team: [] for team in team_totals}
+        self.snapshot = snapshot
+    
+    def reload_match_data(self, file_path: str) -> tuple:
+        """Reload a corrected match file, recomputing only the innings whose deliveries changed"""
+        old_snapshot = self.snapshot
+        
+        # Registered collectors can only be rebuilt from a full pass
+        if old_snapshot.data is None or self.collectors:
+            success, message = self.load_match_data(file_path)
+            if not success:
+                return success, message
+        else:
+            success, message = self._reload_innings(file_path, old_snapshot)
+            if not success:
+                return success, message
+        
+        # Changed innings, deliveries (by ball key) and stats are reported in
+        # reload_changes, which is replaced as a whole once the reload is published
+        changes = self._diff_innings(old_snapshot.innings, self.snapshot.innings)
+        changes['stats'] = self._diff_stats(old_snapshot, self.snapshot)
+        self.reload_changes = changes
+        
+        return True, (f"Reloaded {len(changes['innings'])} changed innings: "
+                      f"{len(changes['deliveries'])} deliveries and "
+                      f"{len(changes['stats'])} stats changed")
+    
+    def _reload_innings(self, file_path: str, old_snapshot: MatchSnapshot) -> tuple:
+        """Publish a new snapshot that reuses the results of unchanged innings"""
+        try:
+            if not os.path.exists(file_path):
+                return False, f"File '{file_path}' not found!"
+            
+            with open(file_path, 'r', encoding='utf-8') as file:
+                new_data = yaml.safe_load(file)
+            
+            if not new_data:
+                return False, "YAML file is empty or invalid!"
+            
+            old_data, old_results = old_snapshot.data, old_snapshot.innings
+            valid, error_msg = self.validate_yaml_structure(new_data)
+            if not valid:
+                return False, error_msg
+            
+            self._strict = False
+            self.validation_errors = []
+            teams = self._identify_teams(new_data)
+            # A different team list changes every bowling team, so nothing can be reused
+            reusable = teams == self._identify_teams(old_data)
+            old_innings = {
+                (innings_index, innings_key): innings_info
+                for innings_index, innings_key, innings_info in self._iter_innings(old_data)
             }
-            self.partnership_stats[team] = []
+            
+            new_results = {}
+            for innings_index, innings_key, innings_info in self._iter_innings(new_data):
+                key = (innings_index, innings_key)
+                previous = old_results.get(key)
+                if reusable and previous is not None and old_innings.get(key) == innings_info:
+                    new_results[key] = previous
+                else:
+                    new_results[key] = self._analyze_innings(innings_info, innings_index, innings_key, teams)
+            
+            self._publish(new_data, teams, new_results)
+            return True, "Successfully reloaded match data"
+            
+        except yaml.YAMLError as e:
+            return False, f"Error parsing YAML: {e}"
+        except Exception as e:
+            return False, f"Unexpected error reloading file: {e}"
+    
+    @classmethod
+    def _diff_innings(cls, old_results: Mapping, new_results: Mapping) -> Dict[str, List]:
+        """Innings and deliveries that differ between two sets of per-innings results"""
+        changes = {'innings': [], 'deliveries': [], 'stats': []}
+        for key, results in new_results.items():
+            previous = old_results.get(key)
+            # Reused innings results are the same object and cannot have changed
+            if previous is results:
+                continue
+            deliveries = cls._diff_deliveries(key[1], previous['balls'] if previous else (), results['balls'])
+            if deliveries or previous is None:
+                changes['innings'].append(key[1])
+                changes['deliveries'].extend(deliveries)
         
-        # Second pass: analyze innings data
-        for innings_index, innings_data in enumerate(self.data['innings']):
-            for innings_key, innings_info in innings_data.items():
-                self._analyze_innings(innings_info, innings_index)
+        for key, previous in old_results.items():
+            if key not in new_results:
+                changes['innings'].append(key[1])
+                changes['deliveries'].extend(cls._diff_deliveries(key[1], previous['balls'], ()))
+        return changes
     
-    def _analyze_innings(self, innings_info: Dict, innings_index: int):
-        """Analyze individual innings data"""
-        team = innings_info.get('team', 'Unknown Team')
-        deliveries = innings_info.get('deliveries', [])
+    @staticmethod
+    def _diff_deliveries(innings_key: str, old_balls, new_balls) -> List[Dict[str, Any]]:
+        """Deliveries added, removed or modified between two versions of an innings, by ball key"""
+        def by_key(balls):
+            keyed = {}
+            seen = defaultdict(int)
+            for ball in balls:
+                # Repeated ball keys are told apart by their occurrence
+                occurrence = seen[ball.key]
+                seen[ball.key] += 1
+                keyed[(ball.key, occurrence)] = ball._replace(line=None)
+            return keyed
         
-        # Determine bowling team (opposite team)
-        all_teams = list(self.batting_stats.keys())
-        bowling_team = None
-        for t in all_teams:
-            if t != team:
-                bowling_team = t
-                break
+        old_keyed = by_key(old_balls)
+        new_keyed = by_key(new_balls)
+        changes = []
+        for key, ball in new_keyed.items():
+            old_ball = old_keyed.get(key)
+            if old_ball is None:
+                changes.append({'innings': innings_key, 'ball': key[0], 'change': 'added'})
+            elif old_ball != ball:
+                changes.append({'innings': innings_key, 'ball': key[0], 'change': 'modified'})
+        for key in old_keyed:
+            if key not in new_keyed:
+                changes.append({'innings': innings_key, 'ball': key[0], 'change': 'removed'})
+        return changes
+    
+    @staticmethod
+    def _diff_stats(old: MatchSnapshot, new: MatchSnapshot) -> List[Dict[str, Any]]:
+        """Every stat that differs between two snapshots"""
+        changes = []
+        
+        def union(new, old):
+            return list(new) + [key for key in old if key not in new]
         
-        if not bowling_team:
-            bowling_team = "Bowling Team"  # Fallback
+        def compare(section, team, player, old, new):
+            for field in union(new, old):
+                if old.get(field) != new.get(field):
+                    changes.append({
+                        'section': section, 'team': team, 'player': player,
+                        'field': field, 'old': old.get(field), 'new': new.get(field)
+                    })
         
-        total_runs = 0
-        total_wickets = 0
-        total_balls = 0
-        extras = 0
+        for section, old_section, new_section in (('batting', old.batting_stats, new.batting_stats),
+                                                  ('bowling', old.bowling_stats, new.bowling_stats)):
+            for team in union(new_section, old_section):
+                old_players = old_section.get(team, {})
+                new_players = new_section.get(team, {})
+                for player in union(new_players, old_players):
+                    compare(section, team, player, old_players.get(player, {}), new_players.get(player, {}))
         
-        current_over_runs = 0
-        current_over_balls = 0
-        last_over = -1
-        last_bowler = None
+        for team in union(new.team_totals, old.team_totals):
+            compare('totals', team, None, old.team_totals.get(team, {}), new.team_totals.get(team, {}))
         
-        batting_order = {}
-        order_counter = 1
+        return changes
+    
+    @staticmethod
+    def _bowling_team_for(team: str, teams: List[str]) -> str:
+        """Determine bowling team (opposite team)"""
+        for t in teams:
+            if t != team:
+                return t
+        return "Bowling Team"  # Fallback
+    
+    def _iter_innings_balls(self, innings_info: Dict, innings_index: int, innings_key: str, teams: List[str]):
+        """Parse the deliveries of an individual innings"""
+        strict = self._strict
+        team = innings_info.get('team', 'Unknown Team')
+        bowling_team = self._bowling_team_for(team, teams)
         
-        for delivery in deliveries:
+        for delivery in innings_info.get('deliveries', []):
+            if strict:
+                if not isinstance(delivery, dict) or len(delivery) != 1:
+                    self._add_validation_error(innings_key, None, delivery, "delivery must be a mapping with a single ball key")
+                    if not isinstance(delivery, dict):
+                        continue
             for ball_key, ball_data in delivery.items():
                 # Handle both string and float ball keys
                 ball_key_str = str(ball_key)
                 try:
-                    over_num = float(ball_key_str.split('.')[0])
-                    ball_num = float(ball_key_str.split('.')[1]) if '.' in ball_key_str else 0
+                    over_num = int(float(ball_key_str.split('.')[0]))
+                    ball_num = int(ball_key_str.split('.')[1]) if '.' in ball_key_str else 0
                 except (ValueError, IndexError):
+                    if strict:
+                        self._add_validation_error(innings_key, ball_key_str, delivery, "ball key must be of the form <over>.<ball>")
                     continue
                 
-                # Track overs and maiden detection
-                if over_num != last_over:
-                    if last_over != -1 and current_over_balls == 6 and current_over_runs == 0 and last_bowler:
-                        self.bowling_stats[bowling_team][last_bowler]['maidens'] += 1
-                    last_over = over_num
-                    current_over_runs = 0
-                    current_over_balls = 0
+                if strict and not self._validate_delivery(innings_key, ball_key_str, ball_data, delivery):
+                    continue
                 
-                # Extract ball data
                 batsman = ball_data.get('batsman', 'Unknown')
-                bowler = ball_data.get('bowler', 'Unknown')
                 runs = ball_data.get('runs', {})
-                
-                # Track batting order
-                if batsman not in batting_order:
-                    batting_order[batsman] = order_counter
-                    self.batting_stats[team][batsman]['position'] = order_counter
-                    order_counter += 1
-                
-                batsman_runs = runs.get('batsman', 0)
-                total_runs_this_ball = runs.get('total', 0)
                 extras_this_ball = runs.get('extras', 0)
                 
-                # Update batting stats for batting team
-                self.batting_stats[team][batsman]['runs'] += batsman_runs
-                
-                # Only count legal deliveries for balls faced
-                if extras_this_ball == 0 or not ball_data.get('extras', {}):
-                    self.batting_stats[team][batsman]['balls'] += 1
-                    current_over_balls += 1
-                    total_balls += 1
-                
-                # Count boundaries
-                if batsman_runs == 4:
-                    self.batting_stats[team][batsman]['fours'] += 1
-                elif batsman_runs == 6:
-                    self.batting_stats[team][batsman]['sixes'] += 1
-                
-                # Update bowling stats for bowling team
-                if extras_this_ball == 0 or not ball_data.get('extras', {}):
-                    self.bowling_stats[bowling_team][bowler]['overs'] += 1/6
-                
-                self.bowling_stats[bowling_team][bowler]['runs'] += total_runs_this_ball
-                
-                # Count dot balls
-                if total_runs_this_ball == 0:
-                    self.bowling_stats[bowling_team][bowler]['dots'] += 1
-                
-                # Handle wickets - update bowling team's wicket count
+                wicket_kind = player_out = None
+                fielders = ()
                 if 'wicket' in ball_data:
                     wicket_info = ball_data['wicket']
+                    wicket_kind = wicket_info.get('kind', 'Unknown')
                     player_out = wicket_info.get('player_out', batsman)
-                    how_out = wicket_info.get('kind', 'Unknown')
-                    fielders = wicket_info.get('fielders', [])
-                    
-                    # Update batting team's dismissal info
-                    self.batting_stats[team][player_out]['out'] = True
-                    
-                    # Format dismissal details properly
-                    if how_out == 'caught':
-                        if fielders:
-                            self.batting_stats[team][player_out]['how_out'] = f"c {', '.join(fielders)} b {bowler}"
-                        else:
-                            self.batting_stats[team][player_out]['how_out'] = f"c & b {bowler}"
-                    elif how_out == 'bowled':
-                        self.batting_stats[team][player_out]['how_out'] = f"b {bowler}"
-                    elif how_out == 'lbw':
-                        self.batting_stats[team][player_out]['how_out'] = f"lbw b {bowler}"
-                    elif how_out == 'stumped':
-                        if fielders:
-                            self.batting_stats[team][player_out]['how_out'] = f"st {', '.join(fielders)} b {bowler}"
-                        else:
-                            self.batting_stats[team][player_out]['how_out'] = f"st b {bowler}"
-                    elif how_out == 'run out':
-                        if fielders:
-                            self.batting_stats[team][player_out]['how_out'] = f"run out ({', '.join(fielders)})"
-                        else:
-                            self.batting_stats[team][player_out]['how_out'] = "run out"
-                    else:
-                        self.batting_stats[team][player_out]['how_out'] = f"{how_out}"
-                        if fielders:
-                            self.batting_stats[team][player_out]['how_out'] += f" ({', '.join(fielders)})"
-                    
-                    # Update bowling team's wicket count
-                    self.bowling_stats[bowling_team][bowler]['wickets'] += 1
-                    total_wickets += 1
+                    fielders = tuple(wicket_info.get('fielders', []))
                 
-                total_runs += total_runs_this_ball
-                extras += extras_this_ball
-                current_over_runs += total_runs_this_ball
-                last_bowler = bowler
-        
-        # Calculate final statistics
-        final_overs = int(last_over) + (current_over_balls / 6) if last_over >= 0 else 0
-        run_rate = (total_runs / final_overs) if final_overs > 0 else 0
-        
-        self.team_totals[team].update({
-            'runs': total_runs,
-            'wickets': total_wickets,
-            'overs': final_overs,
-            'extras': extras,
-            'run_rate': run_rate
-        })
+                yield Ball(
+                    innings=innings_index,
+                    innings_name=innings_key,
+                    team=team,
+                    bowling_team=bowling_team,
+                    key=ball_key_str,
+                    over=over_num,
+                    ball=ball_num,
+                    batsman=batsman,
+                    non_striker=ball_data.get('non_striker'),
+                    bowler=ball_data.get('bowler', 'Unknown'),
+                    batsman_runs=runs.get('batsman', 0),
+                    extras=extras_this_ball,
+                    total=runs.get('total', 0),
+                    # Only legal deliveries count towards balls faced and overs
+                    legal=extras_this_ball == 0 or not ball_data.get('extras', {}),
+                    wicket_kind=wicket_kind,
+                    player_out=player_out,
+                    fielders=fielders,
+                    line=getattr(delivery, 'line', None)
+                )
     
-    def get_match_header_data(self) -> Dict[str, Any]:
-        """Get match header information as structured data"""
-        if not self.data:
-            return {}
-        
-        info = self.data.get('info', {})
-        meta = self.data.get('meta', {})
+    @staticmethod
+    def _build_header(data: Dict) -> Dict[str, Any]:
+        """Match header information from the source document"""
+        info = data.get('info', {})
         
-        header_data = {
+        return {
             'match_type': info.get('match_type', 'Unknown').upper(),
             'venue': info.get('venue', 'Unknown Venue'),
             'city': info.get('city', ''),
@@ -258,72 +558,88 @@ class CricketScoreboard:
             'outcome': info.get('outcome', {}),
             'player_of_match': info.get('player_of_match', [])
         }
-        
-        return header_data
     
-    def get_batting_stats_for_team(self, team: str) -> List[Dict[str, Any]]:
+    def get_match_header_data(self) -> Mapping[str, Any]:
+        """Get match header information as structured data"""
+        return self.snapshot.header
+    
+    def get_batting_stats_for_team(self, team: str) -> Sequence[Mapping[str, Any]]:
         """Get batting statistics for a specific team"""
-        if team not in self.batting_stats:
-            return []
-        
-        stats = []
-        for player, data in self.batting_stats[team].items():
-            if data['runs'] > 0 or data['balls'] > 0 or data['out']:
-                strike_rate = (data['runs'] / data['balls'] * 100) if data['balls'] > 0 else 0
-                stats.append({
-                    'position': data['position'],
-                    'player': player,
-                    'runs': data['runs'],
-                    'balls': data['balls'],
-                    'fours': data['fours'],
-                    'sixes': data['sixes'],
-                    'strike_rate': round(strike_rate, 2),
-                    'out': data['out'],
-                    'how_out': data['how_out'] if data['out'] else 'not out'
-                })
-        
-        # Sort by batting position
-        stats.sort(key=lambda x: x['position'])
-        return stats
+        return self.snapshot.batting.get(team, ())
     
-    def get_bowling_stats_for_team(self, team: str) -> List[Dict[str, Any]]:
+    def get_bowling_stats_for_team(self, team: str) -> Sequence[Mapping[str, Any]]:
         """Get bowling statistics for a specific team"""
-        if team not in self.bowling_stats:
-            return []
-        
-        stats = []
-        for bowler, data in self.bowling_stats[team].items():
-            if data['overs'] > 0 or data['runs'] > 0 or data['wickets'] > 0:
-                economy = (data['runs'] / data['overs']) if data['overs'] > 0 else 0
-                overs_str = f"{int(data['overs'])}.{int((data['overs'] % 1) * 6)}"
-                
-                stats.append({
-                    'bowler': bowler,
-                    'overs': overs_str,
-                    'maidens': data['maidens'],
-                    'runs': data['runs'],
-                    'wickets': data['wickets'],
-                    'economy': round(economy, 2),
-                    'dots': data['dots']
-                })
-        
-        # Sort by wickets (descending) then by economy (ascending)
-        stats.sort(key=lambda x: (-x['wickets'], x['economy']))
-        return stats
+        return self.snapshot.bowling.get(team, ())
     
-    def get_team_totals(self) -> Dict[str, Dict[str, Any]]:
+    def get_team_totals(self) -> Mapping[str, Mapping[str, Any]]:
         """Get team totals for all teams"""
-        return self.team_totals.copy()
+        return self.snapshot.team_totals
+    
+    def export_results(self) -> Dict[str, Any]:
+        """Get all displayed figures as plain data, suitable for caching without the source file"""
+        return self.snapshot.to_dict()
+
+def collect_match_files(paths: List[str]) -> List[str]:
+    """Expand directories, including their subdirectories, into the YAML match files they contain"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for name in sorted(file_names):
+                    if name.endswith(('.yaml', '.yml')):
+                        files.append(os.path.join(dir_path, name))
+        else:
+            files.append(path)
+    return files
+
+
+def file_hash(file_path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def check_cached_file(entry: Optional[Dict[str, Any]], file_path: str,
+                      stat: os.stat_result) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Check a cache entry recorded with a file's size, mtime_ns and hash
+    
+    Unchanged size and mtime means unchanged content, so the file is only
+    hashed when they differ. Returns (entry, hash): the entry, with size and
+    mtime refreshed if they changed, or None if the content changed; and the
+    file's hash if it had to be computed.
+    """
+    if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return entry, None
+    digest = file_hash(file_path)
+    if entry and entry.get('hash') == digest:
+        return dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns), digest
+    return None, digest
 
 if __name__ == "__main__":
     # Command line interface for testing
     if len(sys.argv) > 1:
         scoreboard = CricketScoreboard()
-        success, message = scoreboard.load_match_data(sys.argv[1])
+        strict = '--strict' in sys.argv[2:]
+        success, message = scoreboard.load_match_data(sys.argv[1], strict=strict)
         if success:
             print("Match data loaded successfully!")
             print(f"Teams: {list(scoreboard.team_totals.keys())}")
         else:
             print(f"Error: {message}")
+        
+        # Compare against a corrected version of the same match
+        if success and '--reload' in sys.argv[2:-1]:
+            corrected_file = sys.argv[sys.argv.index('--reload') + 1]
+            success, message = scoreboard.reload_match_data(corrected_file)
+            print(message if success else f"Error: {message}")
+            for change in scoreboard.reload_changes['deliveries']:
+                print(f"  {change['innings']} {change['ball']}: {change['change']}")
+            for change in scoreboard.reload_changes['stats']:
+                who = f"{change['team']} / {change['player']}" if change['player'] else change['team']
+                print(f"  {change['section']} {who} {change['field']}: {change['old']} -> {change['new']}")
     else:
-        print("Usage: python main.py <yaml_file_path>")
+        print("Usage: python main.py <yaml_file_path> [--strict] [--reload <corrected_yaml_file_path>]")
@@ -0,0 +1,305 @@
+import argparse
+import json
+import os
+import sys
+import weakref
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from collectors import Ball, BattingCollector, BowlingCollector, batting_rows, bowling_rows, dispatch_balls
+from main import CricketScoreboard, check_cached_file, collect_match_files
+from snapshot import MatchSnapshot
+
+# Query filters and the delivery column each one is matched against
+FILTER_COLUMNS = {
+    'batter': 'batsman',
+    'bowler': 'bowler',
+    'batting_team': 'team',
+    'bowling_team': 'bowling_team',
+    'venue': 'venue',
+    'match_type': 'match_type',
+    'dismissal': 'wicket_kind',
+}
+
+# Set bit positions for every byte value, used to turn a mask back into row indices
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+_table_cache = weakref.WeakKeyDictionary()
+
+# Parsed deliveries of every queried file, so repeat queries skip YAML parsing and analysis
+QUERY_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cricket_scoreboard", "query_cache.json")
+QUERY_CACHE_VERSION = 1
+
+
+def _mask_indices(mask: int, length: int) -> Iterable[int]:
+    """Row indices of the set bits in a mask"""
+    data = mask.to_bytes((length + 7) // 8, 'little')
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def _positions_mask(positions: List[int], length: int) -> int:
+    """Build a bitmask from row positions without repeated big-integer shifts"""
+    data = bytearray((length + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, 'little')
+
+
+class DeliveryTable:
+    """Columnar form of the deliveries of one or more analyzed matches
+    
+    Every filter is answered with a bitmask over the rows; masks for each
+    distinct value of a column are built once and combined with integer
+    ``&``/``|``, so a query only touches the deliveries it matches.
+    """
+    
+    def __init__(self, snapshots: Sequence[MatchSnapshot] = (),
+                 matches: Sequence[Tuple[str, str, Sequence[Sequence[Ball]]]] = ()):
+        """Build from analyzed snapshots and/or (venue, match type, balls per innings) tuples"""
+        self.balls = []
+        self.columns = defaultdict(list)
+        innings_ids = {}
+        
+        matches = [_snapshot_match(snapshot) for snapshot in snapshots] + list(matches)
+        for match_index, (venue, match_type, innings_balls) in enumerate(matches):
+            for innings_number, balls in enumerate(innings_balls, start=1):
+                for ball in balls:
+                    # Renumber innings across matches so over boundaries never merge
+                    global_innings = innings_ids.setdefault((match_index, ball.innings), len(innings_ids))
+                    self.balls.append(ball._replace(innings=global_innings))
+                    self.columns['venue'].append(venue)
+                    self.columns['match_type'].append(match_type)
+                    self.columns['innings_number'].append(innings_number)
+                    self.columns['match'].append(match_index)
+        
+        self.length = len(self.balls)
+        self.all_rows = (1 << self.length) - 1
+        self._indexes = {}
+    
+    @classmethod
+    def for_snapshot(cls, snapshot: MatchSnapshot) -> 'DeliveryTable':
+        """Cached table for a single match snapshot"""
+        table = _table_cache.get(snapshot)
+        if table is None:
+            table = _table_cache[snapshot] = cls([snapshot])
+        return table
+    
+    def _column(self, name: str) -> List[Any]:
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = [getattr(ball, name) for ball in self.balls]
+        return column
+    
+    def _index(self, name: str) -> Dict[Any, int]:
+        """Bitmask of matching rows for every distinct value of a column"""
+        index = self._indexes.get(name)
+        if index is None:
+            positions = defaultdict(list)
+            for row, value in enumerate(self._column(name)):
+                positions[value].append(row)
+            index = self._indexes[name] = {
+                value: _positions_mask(rows, self.length) for value, rows in positions.items()
+            }
+        return index
+    
+    def mask(self, column: str, values: Union[Any, Iterable[Any]]) -> int:
+        """Rows whose column equals the value, or any of the values"""
+        index = self._index(column)
+        if isinstance(values, (str, int)) or values is None:
+            values = [values]
+        mask = 0
+        for value in values:
+            mask |= index.get(value, 0)
+        return mask
+    
+    def over_mask(self, first: int, last: int) -> int:
+        """Rows in overs first to last, counted from 1 as on a scorecard"""
+        index = self._index('over')
+        mask = 0
+        for over, over_mask in index.items():
+            if first - 1 <= over <= last - 1:
+                mask |= over_mask
+        return mask
+    
+    def select(self, overs: Optional[Tuple[int, int]] = None, innings: Optional[Union[int, str]] = None,
+               **filters) -> int:
+        """Combined mask for a set of filters (see FILTER_COLUMNS)"""
+        mask = self.all_rows
+        if overs is not None:
+            mask &= self.over_mask(*overs)
+        if innings is not None:
+            column = 'innings_name' if isinstance(innings, str) else 'innings_number'
+            mask &= self.mask(column, innings)
+        for name, values in filters.items():
+            if values is None:
+                continue
+            if name not in FILTER_COLUMNS:
+                raise ValueError(f"Unknown filter '{name}'. Choose from: overs, innings, {', '.join(FILTER_COLUMNS)}")
+            mask &= self.mask(FILTER_COLUMNS[name], values)
+        return mask
+    
+    def query(self, **filters) -> Dict[str, Any]:
+        """Batting and bowling figures for the deliveries matching the filters"""
+        mask = self.select(**filters)
+        balls = [self.balls[row] for row in _mask_indices(mask, self.length)]
+        
+        batting = BattingCollector()
+        bowling = BowlingCollector()
+        dispatch_balls(balls, [batting, bowling])
+        
+        return {
+            'deliveries': len(balls),
+            'batting': {team: batting_rows(players) for team, players in batting.stats.items()},
+            'bowling': {team: bowling_rows(bowlers) for team, bowlers in bowling.stats.items()}
+        }
+
+
+def _snapshot_match(snapshot: MatchSnapshot) -> Tuple[str, str, List[Sequence[Ball]]]:
+    """(venue, match type, balls per innings) of an analyzed match"""
+    return (
+        snapshot.header.get('venue', 'Unknown Venue'),
+        snapshot.header.get('match_type', 'Unknown'),
+        [innings['balls'] for innings in snapshot.innings.values()]
+    )
+
+
+def _load_cache(cache_file: str) -> Dict[str, Any]:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        cache = None
+    if (not isinstance(cache, dict) or cache.get('version') != QUERY_CACHE_VERSION
+            or cache.get('fields') != list(Ball._fields) or not isinstance(cache.get('files'), dict)):
+        return {}
+    return cache['files']
+
+
+def _save_cache(cache_file: str, files: Dict[str, Any]):
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_file)), exist_ok=True)
+        with open(cache_file + ".tmp", 'w', encoding='utf-8') as file:
+            json.dump({'version': QUERY_CACHE_VERSION, 'fields': list(Ball._fields), 'files': files}, file)
+        os.replace(cache_file + ".tmp", cache_file)
+    except OSError:
+        pass  # A missing cache only costs re-parsing on the next query
+
+
+def _cached_match(entry: Dict[str, Any]) -> Tuple[str, str, List[List[Ball]]]:
+    """Rebuild a match's deliveries from its cache entry"""
+    innings_balls = []
+    for rows in entry['innings']:
+        balls = [Ball._make(row) for row in rows]
+        innings_balls.append([ball._replace(fielders=tuple(ball.fielders)) for ball in balls])
+    return entry['venue'], entry['match_type'], innings_balls
+
+
+def load_match_deliveries(file_paths: Iterable[str], cache_file: Optional[str] = None) -> Tuple[List, List]:
+    """Deliveries of each match file, reusing the on-disk cache for unchanged files
+    
+    Returns (matches, errors): matches are (venue, match type, balls per
+    innings) tuples for DeliveryTable, errors are (file, message) pairs. Like
+    the site generator's manifest, a file is only hashed when its size or
+    mtime changed and only re-analyzed when its hash changed.
+    """
+    cache = _load_cache(cache_file) if cache_file else {}
+    changed = False
+    matches = []
+    errors = []
+    
+    for file_path in file_paths:
+        key = os.path.abspath(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            errors.append((file_path, f"File '{file_path}' not found!"))
+            continue
+        
+        entry, file_hash = check_cached_file(cache.get(key), file_path, stat)
+        if entry:
+            # A refreshed entry has the same content but a new size or mtime
+            if entry is not cache[key]:
+                cache[key] = entry
+                changed = True
+            matches.append(_cached_match(entry))
+            continue
+        
+        scoreboard = CricketScoreboard()
+        success, message = scoreboard.load_match_data(file_path)
+        if not success:
+            errors.append((file_path, message))
+            continue
+        
+        match = _snapshot_match(scoreboard.snapshot)
+        matches.append(match)
+        cache[key] = {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': file_hash,
+            'venue': match[0], 'match_type': match[1], 'innings': match[2]
+        }
+        changed = True
+    
+    if cache_file and changed:
+        # Entries for files that were moved or deleted are dropped when the cache is rewritten
+        _save_cache(cache_file, {path: entry for path, entry in cache.items() if os.path.exists(path)})
+    return matches, errors
+
+
+def query_scoreboard(scoreboard: CricketScoreboard, **filters) -> Dict[str, Any]:
+    """Query the deliveries of a scoreboard's current match"""
+    return DeliveryTable.for_snapshot(scoreboard.snapshot).query(**filters)
+
+
+def _parse_overs(text: str) -> Tuple[int, int]:
+    first, _, last = text.partition('-')
+    return int(first), int(last or first)
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line interface for ad-hoc delivery queries"""
+    parser = argparse.ArgumentParser(description="Batting and bowling figures for a filtered set of deliveries")
+    parser.add_argument('paths', nargs='+', help="match files or directories of match files")
+    parser.add_argument('--overs', type=_parse_overs, help="over range such as 16-20 (counted from 1)")
+    parser.add_argument('--innings', type=int, help="innings number within each match")
+    parser.add_argument('--batter', action='append', help="batter name (repeatable)")
+    parser.add_argument('--bowler', action='append', help="bowler name (repeatable, e.g. a list of spinners)")
+    parser.add_argument('--batting-team', action='append', help="batting team (repeatable)")
+    parser.add_argument('--bowling-team', action='append', help="bowling team (repeatable)")
+    parser.add_argument('--venue', action='append', help="venue (repeatable)")
+    parser.add_argument('--match-type', action='append', help="match type such as T20 (repeatable)")
+    parser.add_argument('--dismissal', action='append', help="dismissal kind such as caught (repeatable)")
+    parser.add_argument('--cache', default=QUERY_CACHE_FILE, help=f"delivery cache file (default: {QUERY_CACHE_FILE})")
+    parser.add_argument('--no-cache', action='store_true', help="parse every match file without using the cache")
+    args = parser.parse_args(argv)
+    
+    matches, errors = load_match_deliveries(collect_match_files(args.paths), None if args.no_cache else args.cache)
+    for file_path, message in errors:
+        print(f"Skipping {file_path}: {message}", file=sys.stderr)
+    
+    match_types = [match_type.upper() for match_type in args.match_type] if args.match_type else None
+    result = DeliveryTable(matches=matches).query(
+        overs=args.overs, innings=args.innings, batter=args.batter, bowler=args.bowler,
+        batting_team=args.batting_team, bowling_team=args.bowling_team, venue=args.venue,
+        match_type=match_types, dismissal=args.dismissal
+    )
+    
+    print(f"{result['deliveries']} matching deliveries from {len(matches)} matches")
+    for team, rows in result['batting'].items():
+        if rows:
+            print(f"\n{team} batting")
+            for row in rows:
+                print(f"  {row['player']:<25} {row['runs']:>4} ({row['balls']}) SR {row['strike_rate']:.2f}")
+    for team, rows in result['bowling'].items():
+        if rows:
+            print(f"\n{team} bowling")
+            for row in rows:
+                print(f"  {row['bowler']:<25} {row['overs']:>5}-{row['maidens']}-{row['runs']}-{row['wickets']}"
+                      f"  Econ {row['economy']:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from main import CricketScoreboard, check_cached_file, collect_match_files
+
+# Bump when page layout or naming changes so every page is re-rendered once
+GENERATOR_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+MATCH_PAGES_DIR = "matches"
+
+PAGE_STYLE = """
+body { font-family: Arial, sans-serif; margin: 2em; color: #222; }
+h1 { margin-bottom: 0.2em; }
+h2 { margin-top: 1.5em; }
+table { border-collapse: collapse; margin: 0.5em 0 1em; }
+th, td { border: 1px solid #ccc; padding: 4px 10px; }
+th { background: #f0f0f0; }
+td.num { text-align: center; }
+.info td:first-child { font-weight: bold; }
+"""
+
+
+def _esc(value: Any) -> str:
+    return html.escape(str(value))
+
+
+def _overs_str(balls: int) -> str:
+    return f"{balls // 6}.{balls % 6}"
+
+
+def _result_text(outcome: Dict[str, Any]) -> str:
+    """Describe the match result the way the GUI does"""
+    if 'winner' in outcome:
+        result_text = f"{outcome['winner']} won"
+        by = outcome.get('by', {})
+        if 'runs' in by:
+            result_text += f" by {by['runs']} runs"
+        elif 'wickets' in by:
+            result_text += f" by {by['wickets']} wickets"
+        return result_text
+    return str(outcome.get('result', ''))
+
+
+def _table(headers: List[str], rows: List[List[Any]], numeric_from: int = 1) -> str:
+    head = "".join(f"<th>{_esc(h)}</th>" for h in headers)
+    body = []
+    for row in rows:
+        cells = "".join(
+            f'<td class="num">{_esc(v)}</td>' if i >= numeric_from else f"<td>{_esc(v)}</td>"
+            for i, v in enumerate(row)
+        )
+        body.append(f"<tr>{cells}</tr>")
+    return f"<table><tr>{head}</tr>{''.join(body)}</table>"
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>{_esc(title)}</title><style>{PAGE_STYLE}</style></head>"
+        f"<body>{body}</body></html>\n"
+    )
+
+
+def render_match_page(results: Dict[str, Any]) -> str:
+    """Render a scorecard page from CricketScoreboard.export_results() data"""
+    header = results['header']
+    teams = header.get('teams', [])
+    title = " vs ".join(teams) if teams else "Match Scorecard"
+    
+    info_rows = [["Match Type", header.get('match_type', 'Unknown')],
+                 ["Venue", header.get('venue', 'Unknown')]]
+    if header.get('city'):
+        info_rows.append(["City", header['city']])
+    info_rows.append(["Date", header.get('date', 'Unknown')])
+    toss = header.get('toss', {})
+    if toss:
+        info_rows.append(["Toss", f"{toss.get('winner', 'Unknown')} won and chose to {toss.get('decision', 'unknown')}"])
+    result = _result_text(header.get('outcome', {}))
+    if result:
+        info_rows.append(["Result", result])
+    pom = header.get('player_of_match', [])
+    if pom:
+        info_rows.append(["Player of the Match", ', '.join(pom) if isinstance(pom, list) else pom])
+    
+    parts = ['<p><a href="../index.html">&larr; All matches</a></p>',
+             f"<h1>{_esc(title)}</h1>",
+             f'<table class="info">{"".join(f"<tr><td>{_esc(k)}</td><td>{_esc(v)}</td></tr>" for k, v in info_rows)}</table>']
+    
+    totals_rows = [
+        [team, t['runs'], t['wickets'], _overs_str(t['balls']), t['extras'], f"{t['run_rate']:.2f}"]
+        for team, t in results['totals'].items()
+    ]
+    parts.append("<h2>Team Totals</h2>")
+    parts.append(_table(["Team", "Runs", "Wickets", "Overs", "Extras", "Run Rate"], totals_rows))
+    
+    for team in results['teams']:
+        batting = results['batting'].get(team, [])
+        if batting:
+            parts.append(f"<h2>{_esc(team)} &ndash; Batting</h2>")
+            parts.append(_table(
+                ["Player", "Runs", "Balls", "4s", "6s", "Strike Rate", "Status"],
+                [[s['player'], s['runs'], s['balls'], s['fours'], s['sixes'],
+                  f"{s['strike_rate']:.2f}", s['how_out']] for s in batting]
+            ))
+        bowling = results['bowling'].get(team, [])
+        if bowling:
+            parts.append(f"<h2>{_esc(team)} &ndash; Bowling</h2>")
+            parts.append(_table(
+                ["Bowler", "Overs", "Maidens", "Runs", "Wickets", "Economy", "Dot Balls"],
+                [[s['bowler'], s['overs'], s['maidens'], s['runs'], s['wickets'],
+                  f"{s['economy']:.2f}", s['dots']] for s in bowling]
+            ))
+    
+    return _page(title, "".join(parts))
+
+
+def render_index_page(entries: List[Dict[str, Any]]) -> str:
+    """Render the archive index from manifest summaries"""
+    entries = sorted(entries, key=lambda e: (str(e['date']), e['page']), reverse=True)
+    rows = "".join(
+        f"<tr><td>{_esc(e['date'])}</td>"
+        f"<td><a href=\"{_esc(e['page'])}\">{_esc(' vs '.join(e['teams']) or e['page'])}</a></td>"
+        f"<td>{_esc(e['match_type'])}</td><td>{_esc(e['venue'])}</td><td>{_esc(e['result'])}</td></tr>"
+        for e in entries
+    )
+    body = (
+        f"<h1>Match Archive</h1><p>{len(entries)} matches</p>"
+        "<table><tr><th>Date</th><th>Match</th><th>Type</th><th>Venue</th><th>Result</th></tr>"
+        f"{rows}</table>"
+    )
+    return _page("Match Archive", body)
+
+
+def _page_name(rel_path: str) -> str:
+    """Stable, collision-free page path for an input file relative to the archive root"""
+    rel_path = rel_path.replace(os.sep, "/")
+    stem = os.path.splitext(rel_path)[0].replace("/", "__")
+    # Flattening can map several inputs (a/b.yaml, a__b.yaml, a/b.yml) to one stem
+    digest = hashlib.sha256(rel_path.encode('utf-8')).hexdigest()[:10]
+    return f"{MATCH_PAGES_DIR}/{stem}-{digest}.html"
+
+
+def _render_match_file(input_path: str, output_path: str) -> Tuple[bool, Any]:
+    """Analyze one match and write its page; runs in a worker process"""
+    scoreboard = CricketScoreboard()
+    success, message = scoreboard.load_match_data(input_path)
+    if not success:
+        return False, message
+    
+    results = scoreboard.export_results()
+    temp_path = output_path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        file.write(render_match_page(results))
+    os.replace(temp_path, output_path)
+    
+    header = results['header']
+    return True, {
+        'date': str(header.get('date', 'Unknown')),
+        'teams': header.get('teams', []),
+        'match_type': header.get('match_type', 'Unknown'),
+        'venue': header.get('venue', 'Unknown Venue'),
+        'result': _result_text(header.get('outcome', {}))
+    }
+
+
+def _find_match_files(input_dir: str) -> List[str]:
+    """Relative paths of all YAML match files under the archive root"""
+    return [os.path.relpath(file_path, input_dir) for file_path in collect_match_files([input_dir])]
+
+
+def _load_manifest(output_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        manifest = None
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('matches'), dict):
+        return {'version': GENERATOR_VERSION, 'matches': {}}
+    return manifest
+
+
+def _save_manifest(output_dir: str, manifest: Dict[str, Any]):
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(manifest, file)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def generate_site(input_dir: str, output_dir: str, jobs: Optional[int] = None, force: bool = False) -> Dict[str, Any]:
+    """Render changed matches under input_dir into a static site in output_dir
+    
+    A manifest of input hashes is kept in the output directory; only new or
+    changed matches are rendered (in parallel), pages of deleted inputs are
+    removed and the index is rebuilt from the manifest.
+    """
+    os.makedirs(os.path.join(output_dir, MATCH_PAGES_DIR), exist_ok=True)
+    manifest = _load_manifest(output_dir)
+    previous = manifest['matches']
+    # Pages from an older generator version are re-rendered, but still cleaned up below
+    reuse = not force and manifest.get('version') == GENERATOR_VERSION
+    current = {}
+    pending = []
+    
+    for rel_path in _find_match_files(input_dir):
+        input_path = os.path.join(input_dir, rel_path)
+        stat = os.stat(input_path)
+        entry, file_hash = check_cached_file(previous.get(rel_path) if reuse else None, input_path, stat)
+        if entry:
+            current[rel_path] = entry
+            continue
+        pending.append((rel_path, {'hash': file_hash, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                   'page': _page_name(rel_path)}))
+    
+    errors = {}
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(_render_match_file, os.path.join(input_dir, rel_path),
+                                os.path.join(output_dir, entry['page']))
+                for rel_path, entry in pending
+            ]
+            for (rel_path, entry), future in zip(pending, futures):
+                try:
+                    success, outcome = future.result()
+                except Exception as e:
+                    success, outcome = False, f"Unexpected error rendering file: {e}"
+                if success:
+                    entry['summary'] = outcome
+                    current[rel_path] = entry
+                else:
+                    errors[rel_path] = outcome
+    
+    # Remove pages no current input uses: deleted or unrenderable inputs and renamed pages
+    removed = 0
+    current_pages = {entry['page'] for entry in current.values()}
+    for entry in previous.values():
+        if entry.get('page') and entry['page'] not in current_pages:
+            try:
+                os.remove(os.path.join(output_dir, entry['page']))
+                removed += 1
+            except OSError:
+                pass
+    
+    manifest['version'] = GENERATOR_VERSION
+    manifest['matches'] = current
+    with open(os.path.join(output_dir, "index.html"), 'w', encoding='utf-8') as file:
+        file.write(render_index_page([
+            dict(entry['summary'], page=entry['page']) for entry in current.values()
+        ]))
+    _save_manifest(output_dir, manifest)
+    
+    return {
+        'rendered': len(pending) - len(errors),
+        'unchanged': len(current) - (len(pending) - len(errors)),
+        'removed': removed,
+        'errors': errors
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line interface for building the scorecard site"""
+    parser = argparse.ArgumentParser(description="Generate static HTML scorecards for a directory of match YAML files")
+    parser.add_argument('input_dir', help="directory containing match YAML files")
+    parser.add_argument('output_dir', help="directory to write the site to")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--force', action='store_true', help="re-render every match, ignoring the manifest")
+    args = parser.parse_args(argv)
+    
+    summary = generate_site(args.input_dir, args.output_dir, jobs=args.jobs, force=args.force)
+    print(f"Rendered {summary['rendered']}, unchanged {summary['unchanged']}, removed {summary['removed']}")
+    for rel_path, message in summary['errors'].items():
+        print(f"Error in {rel_path}: {message}", file=sys.stderr)
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+_EMPTY = MappingProxyType({})
+
+
+def freeze(value: Any) -> Any:
+    """Deep copy dicts, lists and sets into read-only mappings, tuples and frozensets"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)) and not hasattr(value, '_fields'):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, JSON-friendly copy of frozen data"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and not hasattr(value, '_fields'):
+        return [thaw(item) for item in value]
+    return value
+
+
+class MatchSnapshot:
+    """Immutable result of analyzing a match
+    
+    CricketScoreboard builds a complete new snapshot for every load or reload
+    and publishes it with a single reference assignment, so readers on other
+    threads can hold on to the snapshot they got without locks or copies.
+    The source document in ``data`` is shared, not copied, and must not be
+    modified.
+    """
+    __slots__ = (
+        'data', 'header', 'teams', 'batting_stats', 'bowling_stats', 'team_totals',
+        'batting', 'bowling', 'innings', 'collector_results', '__weakref__'
+    )
+    
+    def __init__(self, data: Any = None, header: Mapping = _EMPTY, teams: tuple = (),
+                 batting_stats: Mapping = _EMPTY, bowling_stats: Mapping = _EMPTY,
+                 team_totals: Mapping = _EMPTY, batting: Mapping = _EMPTY, bowling: Mapping = _EMPTY,
+                 innings: Mapping = _EMPTY, collector_results: Mapping = _EMPTY):
+        values = {
+            'data': data,
+            'header': header,
+            'teams': teams,
+            'batting_stats': batting_stats,
+            'bowling_stats': bowling_stats,
+            'team_totals': team_totals,
+            'batting': batting,
+            'bowling': bowling,
+            'innings': innings,
+            'collector_results': collector_results
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("MatchSnapshot is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("MatchSnapshot is immutable")
+    
+    def replace(self, **changes) -> 'MatchSnapshot':
+        """New snapshot with some fields replaced"""
+        values = {name: getattr(self, name) for name in self.__slots__ if name != '__weakref__'}
+        values.update(changes)
+        return MatchSnapshot(**values)
+    
+    @property
+    def totals(self) -> Mapping:
+        """Team totals keyed by team"""
+        return self.team_totals
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Displayed figures as plain data, suitable for caching without the source file"""
+        return {
+            'header': thaw(self.header),
+            'teams': list(self.teams),
+            'batting': thaw(self.batting),
+            'bowling': thaw(self.bowling),
+            'totals': thaw(self.team_totals)
+        }
+    
+    @classmethod
+    def from_dict(cls, results: Dict[str, Any]) -> 'MatchSnapshot':
+        """Rebuild a display-only snapshot from to_dict() output"""
+        return cls(
+            header=freeze(results['header']),
+            teams=tuple(results['teams']),
+            team_totals=freeze(results['totals']),
+            batting=freeze(results['batting']),
+            bowling=freeze(results['bowling'])
+        )